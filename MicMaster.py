@@ -1,92 +1,309 @@
+import argparse
+import atexit
+import importlib
 import json
 import logging
+import math
+import mmap
+import multiprocessing
 import os
+import re
 import sys
 import time
+import warnings
+from bisect import bisect_left
+from contextlib import contextmanager
 from ctypes import POINTER
-from threading import Thread
-
-import keyboard
-import psutil
-import pythoncom
-import requests
-import winsound
-from comtypes import CLSCTX_ALL
+from dataclasses import dataclass, replace
+from itertools import combinations
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
+from threading import Condition, Event, Lock, Thread, current_thread, local
+from typing import NamedTuple
+
 from ctypes import cast
-from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-from plyer import notification
-from win10toast_click import ToastNotifier
-from PyQt5.QtCore import Qt, QEvent, QTimer, pyqtSignal, pyqtSlot
+
+QT_IMPORT_START = time.perf_counter()
+from PyQt5.QtCore import Qt, QEvent, QTimer, pyqtSignal, QAbstractListModel, QModelIndex
 from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QVBoxLayout, QLabel, QSlider, QHBoxLayout,
     QCheckBox, QSystemTrayIcon, QMenu, QAction, QDialog, QComboBox, QMessageBox,
-    QListWidget, QListWidgetItem, QDialogButtonBox, QAbstractItemView,
-    QInputDialog, QProgressBar, QTextEdit
+    QListWidget, QListWidgetItem, QDialogButtonBox, QAbstractItemView, QSpinBox,
+    QInputDialog, QProgressBar, QLineEdit, QTableView, QHeaderView, QTableWidget, QTableWidgetItem,
+    QFileDialog
 )
-
-import pyaudio
-import numpy as np
+QT_IMPORT_END = time.perf_counter()
 
 VERSION = "1.0.0"
 SETTINGS_FILE = 'settings.json'
 LOG_FILE = 'app.log'
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_RATE_LIMIT_INTERVAL = 5.0
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+LOG_INDEX_CHUNK = 4 * 1024 * 1024
+LOG_LINE_CACHE = 4096
+FULL_SCALE = 32768.0
+SILENCE_DBFS = -96.0
+SILENCE_RMS = 10.0 ** (SILENCE_DBFS / 20.0)
+DIGITAL_SILENCE_SECONDS = 2.0
+UPDATE_URL = "https://api.github.com/repos/balki97/MicMaster/releases/latest"
+UPDATE_CACHE_FILE = 'update_cache.json'
+UPDATE_CACHE_TTL = 6 * 3600
+UPDATE_BASE_BACKOFF = 60
+UPDATE_MAX_BACKOFF = 24 * 3600
+SETTINGS_SCHEMA_VERSION = 2
+THEMES = ('Dark', 'Light')
+THEME_STYLESHEETS = {
+    'Dark': """
+        QWidget { background-color: #1e1e1e; color: #c5c6c7; font-family: "Segoe UI"; font-size: 10pt; }
+        QPushButton { background-color: #282a36; border: 2px solid #44475a; border-radius: 8px; padding: 8px; color: #f8f8f2; }
+        QPushButton:hover { background-color: #44475a; }
+        QPushButton:pressed { background-color: #6272a4; }
+        QSlider::groove:horizontal { height: 8px; background: #44475a; border-radius: 4px; }
+        QSlider::handle:horizontal { background: #50fa7b; border: 1px solid #bd93f9; width: 14px; margin: -3px 0; border-radius: 7px; }
+        QLabel { color: #f8f8f2; }
+        QComboBox { background-color: #282a36; border: 1px solid #44475a; border-radius: 8px; padding: 4px; color: #f8f8f2; }
+        QProgressBar { border: 2px solid #44475a; border-radius: 8px; background-color: #282a36; text-align: center; }
+        QProgressBar::chunk { background-color: #50fa7b; border-radius: 4px; }
+    """,
+    'Light': """
+        QWidget { background-color: #f5f5f5; color: #2e2e2e; font-family: "Segoe UI"; font-size: 10pt; }
+        QPushButton { background-color: #ffffff; border: 2px solid #c5c5c5; border-radius: 8px; padding: 8px; color: #2e2e2e; }
+        QPushButton:hover { background-color: #e0e0e0; }
+        QPushButton:pressed { background-color: #d5d5d5; }
+        QSlider::groove:horizontal { height: 8px; background: #c5c5c5; border-radius: 4px; }
+        QSlider::handle:horizontal { background: #0078d7; border: 1px solid #005a9e; width: 14px; margin: -3px 0; border-radius: 7px; }
+        QLabel { color: #2e2e2e; }
+        QComboBox { background-color: #ffffff; border: 1px solid #c5c5c5; border-radius: 8px; padding: 4px; color: #2e2e2e; }
+        QProgressBar { border: 2px solid #c5c5c5; border-radius: 8px; background-color: #ffffff; text-align: center; }
+        QProgressBar::chunk { background-color: #0078d7; border-radius: 4px; }
+    """
+}
+E_CAPTURE = 1
+E_MULTIMEDIA = 1
+DEVICE_STATE_ACTIVE = 1
+APP_ICON = os.path.join("icons", "mic_switch_icon.ico")
+MIC_ON_IMAGE = os.path.join("images", "mic_on.png")
+MIC_OFF_IMAGE = os.path.join("images", "mic_off.png")
+MUTE_SOUND = os.path.join("sounds", "mute_sound.wav")
+UNMUTE_SOUND = os.path.join("sounds", "unmute_sound.wav")
+
+class StartupProfiler:
+    def __init__(self, origin: float):
+        self.origin = origin
+        self.enabled = False
+        self.phases = []
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+    def record(self, name: str, start: float, end: float):
+        self.phases.append((name, start - self.origin, end - start))
+    def report(self) -> dict:
+        return {
+            'total_ms': (time.perf_counter() - self.origin) * 1000.0,
+            'phases': [{'name': name, 'start_ms': start * 1000.0, 'duration_ms': duration * 1000.0}
+                       for name, start, duration in sorted(self.phases, key=lambda phase: phase[1])]
+        }
+
+STARTUP_PROFILER = StartupProfiler(QT_IMPORT_START)
+STARTUP_PROFILER.record("import PyQt5", QT_IMPORT_START, QT_IMPORT_END)
+
+def lazy_import(name: str):
+    module = sys.modules.get(name)
+    if module is None:
+        with STARTUP_PROFILER.phase(f"import {name}"):
+            module = importlib.import_module(name)
+    return module
+
+mic_log = logging.getLogger('micmaster.mic')
+audio_log = logging.getLogger('micmaster.audio')
+hotkey_log = logging.getLogger('micmaster.hotkey')
+automute_log = logging.getLogger('micmaster.automute')
+settings_log = logging.getLogger('micmaster.settings')
+update_log = logging.getLogger('micmaster.updates')
+log_listener = None
+configured_log_levels = set()
+
+class RateLimitFilter(logging.Filter):
+    DIGITS = re.compile(r'\d+')
+    def __init__(self, interval: float = LOG_RATE_LIMIT_INTERVAL, max_keys: int = 1000):
+        super().__init__()
+        self.interval = interval
+        self.max_keys = max_keys
+        self._last = {}
+        self._suppressed = {}
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not getattr(record, 'rate_limit', False):
+            return True
+        message = record.getMessage()
+        key = (record.name, self.DIGITS.sub('#', message))
+        now = time.monotonic()
+        last = self._last.get(key)
+        if last is not None and now - last < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+        if len(self._last) >= self.max_keys:
+            self._last.clear()
+        self._last[key] = now
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            record.msg = f"{message} ({suppressed} similar messages suppressed)"
+            record.args = None
+        return True
 
-def setup_logging(enable_logging: bool) -> None:
+def setup_logging(enable_logging: bool, levels: dict = None) -> None:
+    global log_listener
+    shutdown_logging()
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     if logger.hasHandlers():
         logger.handlers.clear()
+    for name in configured_log_levels:
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    configured_log_levels.clear()
+    for name, level in (levels or {}).items():
+        try:
+            logging.getLogger(name).setLevel(str(level).upper())
+            configured_log_levels.add(name)
+        except ValueError:
+            logging.warning(f"Invalid log level '{level}' for '{name}'.")
     if enable_logging:
         try:
-            handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+            handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
             formatter = logging.Formatter('%(asctime)s:%(levelname)s:%(message)s')
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
+            log_queue = SimpleQueue()
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.addFilter(RateLimitFilter())
+            logger.addHandler(queue_handler)
+            log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+            log_listener.start()
             logging.info("Logging enabled.")
         except Exception as e:
             QMessageBox.critical(None, "Logging Error", f"Failed to enable logging: {e}")
 
+def shutdown_logging() -> None:
+    global log_listener
+    if log_listener:
+        log_listener.stop()
+        for handler in log_listener.handlers:
+            handler.close()
+        log_listener = None
+
+atexit.register(shutdown_logging)
+
 def is_process_running(exe_name: str) -> bool:
+    psutil = lazy_import('psutil')
     return any(proc.info['name'] == exe_name for proc in psutil.process_iter(['name']))
 
-def check_for_updates_notify(parent):
-    try:
-        parent.update_status_label.setText("Checking for updates...")
-        parent.update_status_label.repaint()
-        owner = "balki97"
-        repo = "MicMaster"
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-        response = requests.get(api_url, timeout=10)
-        if response.status_code == 404:
-            parent.update_status_label.setText("No releases found on GitHub.")
-            return
-        response.raise_for_status()
-        latest_release = response.json()
-        download_url = ""
-        assets = latest_release.get('assets', [])
-        if assets:
-            download_url = assets[0].get('browser_download_url', '')
-        latest_version = latest_release.get('tag_name', '').lstrip('v')
+@dataclass
+class UpdateResult:
+    status: str
+    message: str
+    latest_version: str = ''
+    download_url: str = ''
+    from_cache: bool = False
+    stale: bool = False
+
+class UpdateChecker(Thread):
+    def __init__(self, callback, url: str = UPDATE_URL, cache_path: str = UPDATE_CACHE_FILE,
+                 ttl: float = UPDATE_CACHE_TTL, force: bool = False, timeout: float = 10):
+        super().__init__()
+        self.daemon = True
+        self.callback = callback
+        self.url = url
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.force = force
+        self.timeout = timeout
+    def run(self):
+        try:
+            result = self.check()
+        except Exception as e:
+            update_log.error(f"Error checking updates: {e}")
+            result = UpdateResult('error', "Error checking updates.")
+        self.callback(result)
+    def load_cache(self) -> dict:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and cache.get('url') == self.url:
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {'url': self.url}
+    def save_cache(self, cache: dict):
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            update_log.warning(f"Could not write update cache: {e}")
+    def check(self) -> UpdateResult:
+        cache = self.load_cache()
+        now = time.time()
+        if not self.force:
+            if now < cache.get('retry_at', 0):
+                if 'release' in cache:
+                    return self.cached(cache, now)
+                return UpdateResult('error', "Update check postponed after recent failures.")
+            if 'release' in cache and now - cache.get('fetched_at', 0) < self.ttl:
+                return self.evaluate(cache['release'], True)
+        headers = {'Accept': 'application/vnd.github+json'}
+        if cache.get('etag') and 'release' in cache:
+            headers['If-None-Match'] = cache['etag']
+        try:
+            response = lazy_import('requests').get(self.url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                update_log.info("Update check: release unchanged.")
+            elif response.status_code == 404:
+                cache['release'] = None
+                cache['etag'] = response.headers.get('ETag')
+            else:
+                response.raise_for_status()
+                latest_release = response.json()
+                assets = latest_release.get('assets', [])
+                cache['release'] = {
+                    'tag_name': latest_release.get('tag_name', ''),
+                    'download_url': assets[0].get('browser_download_url', '') if assets else ''
+                }
+                cache['etag'] = response.headers.get('ETag')
+        except Exception as e:
+            failures = cache.get('failures', 0) + 1
+            cache['failures'] = failures
+            cache['retry_at'] = now + min(UPDATE_MAX_BACKOFF, UPDATE_BASE_BACKOFF * 2 ** (failures - 1))
+            self.save_cache(cache)
+            if 'release' not in cache:
+                raise
+            update_log.warning(f"Error checking updates: {e}; using the cached release.")
+            return self.cached(cache, now)
+        cache['fetched_at'] = now
+        cache['failures'] = 0
+        cache.pop('retry_at', None)
+        self.save_cache(cache)
+        return self.evaluate(cache.get('release'), False)
+    def cached(self, cache: dict, now: float) -> UpdateResult:
+        result = self.evaluate(cache['release'], True)
+        if now - cache.get('fetched_at', 0) < self.ttl:
+            return result
+        return replace(result, stale=True, message=f"{result.message} (last known release; GitHub could not be reached)")
+    def evaluate(self, release, from_cache: bool) -> UpdateResult:
+        if release is None:
+            return UpdateResult('none', "No releases found on GitHub.", from_cache=from_cache)
+        latest_version = release.get('tag_name', '').lstrip('v')
         if not latest_version:
-            logging.warning("Latest version not found.")
-            parent.update_status_label.setText("Failed to retrieve version info.")
-            return
+            update_log.warning("Latest version not found.")
+            return UpdateResult('error', "Failed to retrieve version info.", from_cache=from_cache)
         if version_tuple(latest_version) > version_tuple(VERSION):
-            msg = (f"New version {latest_version} available.\n"
-                   f"You have {VERSION}.\n"
-                   "Please download the latest version from:\n" + download_url)
-            QMessageBox.information(parent, "Update Available", msg)
-            parent.update_status_label.setText("Update available.")
-        else:
-            parent.update_status_label.setText("You are using the latest version.")
-            logging.info("Latest version in use.")
-    except Exception as e:
-        logging.error(f"Error checking updates: {e}")
-        parent.update_status_label.setText("Error checking updates.")
-    finally:
-        if hasattr(parent, 'check_updates_btn') and parent.check_updates_btn is not None:
-            parent.check_updates_btn.setEnabled(True)
+            return UpdateResult('update', "Update available.", latest_version, release.get('download_url', ''), from_cache)
+        return UpdateResult('latest', "You are using the latest version.", latest_version, from_cache=from_cache)
 
 def version_tuple(v):
     try:
@@ -94,26 +311,1973 @@ def version_tuple(v):
     except Exception:
         return (0,)
 
+def percentile(sorted_samples: list, q: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, int(round(q / 100.0 * (len(sorted_samples) - 1)))))
+    return sorted_samples[index]
+
+@dataclass(frozen=True)
+class AudioEndpoint:
+    id: str
+    name: str
+    is_default: bool = False
+
+class EndpointSnapshot(NamedTuple):
+    endpoints: list
+    current_id: str
+    muted: bool
+    level: float
+
+class DeviceManager:
+    def __init__(self, backend):
+        self.backend = backend
+        self.endpoints = {}
+        self.default_id = None
+        self.selected_id = None
+        self.activations = 0
+        self._handles = {}
+        self._events = []
+        self._lock = Lock()
+    @property
+    def current_id(self) -> str:
+        if self.selected_id in self.endpoints:
+            return self.selected_id
+        if self.default_id in self.endpoints:
+            return self.default_id
+        return next(iter(self.endpoints), None)
+    def refresh(self):
+        with self._lock:
+            self._events.clear()
+        endpoints = self.backend.enumerate_endpoints()
+        self.endpoints = {endpoint.id: endpoint for endpoint in endpoints}
+        self.default_id = next((endpoint.id for endpoint in endpoints if endpoint.is_default), None)
+        for endpoint_id in [endpoint_id for endpoint_id in self._handles if endpoint_id not in self.endpoints]:
+            self._release(endpoint_id)
+    def handle(self, endpoint_id: str = None):
+        endpoint_id = endpoint_id or self.current_id
+        if endpoint_id is None:
+            return None
+        handle = self._handles.get(endpoint_id)
+        if handle is None:
+            handle = self.backend.activate(endpoint_id)
+            self._handles[endpoint_id] = handle
+            self.activations += 1
+        return handle
+    def handles(self) -> list:
+        return [self.handle(endpoint_id) for endpoint_id in list(self.endpoints)]
+    def _release(self, endpoint_id: str):
+        handle = self._handles.pop(endpoint_id, None)
+        if handle is not None:
+            self.backend.release(handle)
+    def post(self, event: str, endpoint_id: str):
+        with self._lock:
+            self._events.append((event, endpoint_id))
+    def pending(self) -> bool:
+        with self._lock:
+            return bool(self._events)
+    def apply_events(self) -> bool:
+        with self._lock:
+            events, self._events = self._events, []
+        previous = self.current_id
+        for event, endpoint_id in events:
+            if event == 'added':
+                if endpoint_id not in self.endpoints:
+                    endpoint = self.backend.describe_endpoint(endpoint_id)
+                    if endpoint is not None:
+                        self.endpoints[endpoint_id] = replace(endpoint, is_default=endpoint_id == self.default_id)
+                        mic_log.info(f"Microphone '{endpoint.name}' connected.")
+            elif event == 'removed':
+                endpoint = self.endpoints.pop(endpoint_id, None)
+                self._release(endpoint_id)
+                if endpoint is not None:
+                    mic_log.info(f"Microphone '{endpoint.name}' disconnected.")
+            elif event == 'default' and endpoint_id != self.default_id:
+                for changed_id in (self.default_id, endpoint_id):
+                    if changed_id in self.endpoints:
+                        self.endpoints[changed_id] = replace(self.endpoints[changed_id], is_default=changed_id == endpoint_id)
+                self.default_id = endpoint_id
+        return self.current_id != previous
+    def close(self):
+        for endpoint_id in list(self._handles):
+            self._release(endpoint_id)
+        self.endpoints = {}
+        self.default_id = None
+
+class MicBackend:
+    name = 'abstract'
+    def __init__(self):
+        self.available = False
+        self.devices = DeviceManager(self)
+        self._subscribers = []
+        self._device_subscribers = []
+        self._watched = None
+    def enumerate_endpoints(self) -> list:
+        raise NotImplementedError
+    def describe_endpoint(self, endpoint_id: str) -> AudioEndpoint:
+        raise NotImplementedError
+    def activate(self, endpoint_id: str):
+        raise NotImplementedError
+    def release(self, handle):
+        pass
+    def _get_mute(self, handle) -> bool:
+        raise NotImplementedError
+    def _set_mute(self, handle, muted: bool):
+        raise NotImplementedError
+    def _get_volume(self, handle) -> float:
+        raise NotImplementedError
+    def _set_volume(self, handle, level: float):
+        raise NotImplementedError
+    def _watch(self, handle):
+        pass
+    def _unwatch(self, handle):
+        pass
+    def _watch_devices(self):
+        pass
+    def _unwatch_devices(self):
+        pass
+    def open(self) -> bool:
+        self.devices.refresh()
+        if self.devices.handle() is None:
+            return False
+        self.available = True
+        self._watch_devices()
+        self._rewatch()
+        return True
+    def close(self):
+        self._unwatch_devices()
+        if self._watched is not None:
+            self._unwatch(self._watched)
+            self._watched = None
+        self.devices.close()
+        self.available = False
+    def _current(self):
+        if self.devices.pending():
+            self.apply_device_changes()
+        handle = self.devices.handle()
+        if handle is None:
+            raise RuntimeError("No microphone found.")
+        return handle
+    def _rewatch(self):
+        handle = self.devices.handle()
+        if handle is self._watched:
+            return
+        if self._watched is not None:
+            self._unwatch(self._watched)
+        self._watched = handle
+        if handle is not None and self._subscribers:
+            self._watch(handle)
+    def apply_device_changes(self) -> bool:
+        changed = self.devices.apply_events()
+        self._rewatch()
+        return changed
+    def select_endpoint(self, endpoint_id: str):
+        self.devices.selected_id = endpoint_id
+        if self.devices.pending():
+            self.apply_device_changes()
+        else:
+            self._rewatch()
+    def snapshot(self) -> EndpointSnapshot:
+        if self.devices.pending():
+            self.apply_device_changes()
+        handle = self.devices.handle()
+        endpoints = list(self.devices.endpoints.values())
+        if handle is None:
+            return EndpointSnapshot(endpoints, None, False, 0.0)
+        return EndpointSnapshot(endpoints, self.devices.current_id, self._get_mute(handle), self._get_volume(handle))
+    def get_mute(self) -> bool:
+        return self._get_mute(self._current())
+    def set_mute(self, muted: bool):
+        self._set_mute(self._current(), muted)
+    def set_mute_all(self, muted: bool) -> int:
+        self._current()
+        handles = self.devices.handles()
+        for handle in handles:
+            self._set_mute(handle, muted)
+        return len(handles)
+    def get_volume(self) -> float:
+        return self._get_volume(self._current())
+    def set_volume(self, level: float):
+        self._set_volume(self._current(), level)
+    def list_endpoints(self) -> list:
+        if self.devices.pending():
+            self.apply_device_changes()
+        return list(self.devices.endpoints.values())
+    def subscribe(self, callback):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+    def subscribe_devices(self, callback):
+        if callback not in self._device_subscribers:
+            self._device_subscribers.append(callback)
+    def _notify(self, muted: bool, level: float):
+        for callback in list(self._subscribers):
+            try:
+                callback(muted, level)
+            except Exception as e:
+                mic_log.error(f"Error in backend subscriber: {e}")
+    def _post_device_event(self, event: str, endpoint_id: str):
+        self.devices.post(event, endpoint_id)
+        for callback in list(self._device_subscribers):
+            try:
+                callback()
+            except Exception as e:
+                mic_log.error(f"Error in device subscriber: {e}")
+
+class PycawBackend(MicBackend):
+    name = 'pycaw'
+    def __init__(self):
+        super().__init__()
+        self._enumerator = None
+        self._callback = None
+        self._client = None
+        self._com = local()
+    def _ensure_com(self):
+        if not getattr(self._com, 'initialized', False):
+            import pythoncom
+            pythoncom.CoInitialize()
+            self._com.initialized = True
+    def _device_enumerator(self):
+        self._ensure_com()
+        if self._enumerator is None:
+            from pycaw.pycaw import AudioUtilities
+            self._enumerator = AudioUtilities.GetDeviceEnumerator()
+        return self._enumerator
+    def enumerate_endpoints(self) -> list:
+        from pycaw.pycaw import AudioUtilities
+        enumerator = self._device_enumerator()
+        try:
+            default_id = enumerator.GetDefaultAudioEndpoint(E_CAPTURE, E_MULTIMEDIA).GetId()
+        except Exception:
+            default_id = None
+        collection = enumerator.EnumAudioEndpoints(E_CAPTURE, DEVICE_STATE_ACTIVE)
+        endpoints = []
+        for i in range(collection.GetCount()):
+            device = AudioUtilities.CreateDevice(collection.Item(i))
+            endpoints.append(AudioEndpoint(device.id, device.FriendlyName, device.id == default_id))
+        return endpoints
+    def describe_endpoint(self, endpoint_id: str) -> AudioEndpoint:
+        from pycaw.api.mmdeviceapi import IMMEndpoint
+        from pycaw.pycaw import AudioUtilities
+        device = self._device_enumerator().GetDevice(endpoint_id)
+        if device.GetState() != DEVICE_STATE_ACTIVE or device.QueryInterface(IMMEndpoint).GetDataFlow() != E_CAPTURE:
+            return None
+        return AudioEndpoint(endpoint_id, AudioUtilities.CreateDevice(device).FriendlyName)
+    def activate(self, endpoint_id: str):
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import IAudioEndpointVolume
+        interface = self._device_enumerator().GetDevice(endpoint_id).Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+        return cast(interface, POINTER(IAudioEndpointVolume))
+    def _watch(self, handle):
+        from comtypes import COMObject
+        from pycaw.pycaw import IAudioEndpointVolumeCallback
+        backend = self
+        class VolumeCallback(COMObject):
+            _com_interfaces_ = [IAudioEndpointVolumeCallback]
+            def OnNotify(self, pNotify):
+                data = pNotify.contents
+                backend._notify(bool(data.bMuted), float(data.fMasterVolume))
+                return 0
+        try:
+            self._callback = VolumeCallback()
+            handle.RegisterControlChangeNotify(self._callback)
+        except Exception as e:
+            self._callback = None
+            mic_log.warning(f"Endpoint change notifications unavailable: {e}")
+    def _unwatch(self, handle):
+        if self._callback is not None:
+            try:
+                handle.UnregisterControlChangeNotify(self._callback)
+            except Exception as e:
+                mic_log.warning(f"Error unregistering endpoint notifications: {e}")
+        self._callback = None
+    def _watch_devices(self):
+        from comtypes import COMObject
+        from pycaw.api.mmdeviceapi import IMMNotificationClient
+        if self._client is not None:
+            return
+        backend = self
+        class NotificationClient(COMObject):
+            _com_interfaces_ = [IMMNotificationClient]
+            def OnDeviceStateChanged(self, pwstrDeviceId, dwNewState):
+                backend._post_device_event('added' if dwNewState == DEVICE_STATE_ACTIVE else 'removed', pwstrDeviceId)
+                return 0
+            def OnDeviceAdded(self, pwstrDeviceId):
+                backend._post_device_event('added', pwstrDeviceId)
+                return 0
+            def OnDeviceRemoved(self, pwstrDeviceId):
+                backend._post_device_event('removed', pwstrDeviceId)
+                return 0
+            def OnDefaultDeviceChanged(self, flow, role, pwstrDefaultDeviceId):
+                if flow == E_CAPTURE and role == E_MULTIMEDIA:
+                    backend._post_device_event('default', pwstrDefaultDeviceId)
+                return 0
+            def OnPropertyValueChanged(self, pwstrDeviceId, key):
+                return 0
+        try:
+            self._client = NotificationClient()
+            self._device_enumerator().RegisterEndpointNotificationCallback(self._client)
+        except Exception as e:
+            self._client = None
+            mic_log.warning(f"Device change notifications unavailable: {e}")
+    def _unwatch_devices(self):
+        if self._client is not None and self._enumerator is not None:
+            try:
+                self._enumerator.UnregisterEndpointNotificationCallback(self._client)
+            except Exception as e:
+                mic_log.warning(f"Error unregistering device notifications: {e}")
+        self._client = None
+    def close(self):
+        super().close()
+        self._enumerator = None
+    def _get_mute(self, handle) -> bool:
+        self._ensure_com()
+        return bool(handle.GetMute())
+    def _set_mute(self, handle, muted: bool):
+        self._ensure_com()
+        handle.SetMute(1 if muted else 0, None)
+        if self._subscribers and self._callback is None and handle is self._watched:
+            self._notify(muted, handle.GetMasterVolumeLevelScalar())
+    def _get_volume(self, handle) -> float:
+        self._ensure_com()
+        return handle.GetMasterVolumeLevelScalar()
+    def _set_volume(self, handle, level: float):
+        self._ensure_com()
+        handle.SetMasterVolumeLevelScalar(level, None)
+        if self._subscribers and self._callback is None and handle is self._watched:
+            self._notify(bool(handle.GetMute()), level)
+
+class FakeMicBackend(MicBackend):
+    name = 'fake'
+    def __init__(self, latency: float = 0.0, endpoints: list = None):
+        super().__init__()
+        self.latency = latency
+        self.calls = 0
+        self.enumerations = 0
+        self.endpoints = endpoints or [AudioEndpoint('fake-capture-0', 'Fake Microphone', True)]
+        self.states = {}
+    @property
+    def muted(self) -> bool:
+        return self.states.get(self.devices.current_id, [False, 1.0])[0]
+    @property
+    def level(self) -> float:
+        return self.states.get(self.devices.current_id, [False, 1.0])[1]
+    def _simulate_call(self):
+        self.calls += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+    def enumerate_endpoints(self) -> list:
+        self._simulate_call()
+        self.enumerations += 1
+        return list(self.endpoints)
+    def describe_endpoint(self, endpoint_id: str) -> AudioEndpoint:
+        self._simulate_call()
+        return next((endpoint for endpoint in self.endpoints if endpoint.id == endpoint_id), None)
+    def activate(self, endpoint_id: str):
+        self._simulate_call()
+        return self.states.setdefault(endpoint_id, [False, 1.0])
+    def _get_mute(self, handle) -> bool:
+        self._simulate_call()
+        return handle[0]
+    def _set_mute(self, handle, muted: bool):
+        self._simulate_call()
+        handle[0] = bool(muted)
+        if handle is self._watched:
+            self._notify(handle[0], handle[1])
+    def _get_volume(self, handle) -> float:
+        self._simulate_call()
+        return handle[1]
+    def _set_volume(self, handle, level: float):
+        self._simulate_call()
+        handle[1] = min(1.0, max(0.0, float(level)))
+        if handle is self._watched:
+            self._notify(handle[0], handle[1])
+    def simulate_external_change(self, muted: bool = None, level: float = None):
+        state = self.states.setdefault(self.devices.current_id, [False, 1.0])
+        if muted is not None:
+            state[0] = bool(muted)
+        if level is not None:
+            state[1] = min(1.0, max(0.0, float(level)))
+        self._notify(state[0], state[1])
+    def simulate_device_added(self, endpoint: AudioEndpoint):
+        self.endpoints.append(replace(endpoint, is_default=False))
+        self._post_device_event('added', endpoint.id)
+        if endpoint.is_default:
+            self.simulate_default_changed(endpoint.id)
+    def simulate_device_removed(self, endpoint_id: str):
+        self.endpoints = [endpoint for endpoint in self.endpoints if endpoint.id != endpoint_id]
+        self.states.pop(endpoint_id, None)
+        self._post_device_event('removed', endpoint_id)
+    def simulate_default_changed(self, endpoint_id: str):
+        self.endpoints = [replace(endpoint, is_default=endpoint.id == endpoint_id) for endpoint in self.endpoints]
+        self._post_device_event('default', endpoint_id)
+
+class MeterReading(NamedTuple):
+    peak: float
+    rms: float
+    dbfs: float
+    level: int
+
+SILENT_READING = MeterReading(0.0, 0.0, SILENCE_DBFS, 0)
+
+def load_audioop():
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            return lazy_import('audioop')
+        except ImportError:
+            return None
+
+class MeteringEngine:
+    def __init__(self, max_frames: int = 4096, accelerated: bool = True):
+        self._audioop = load_audioop() if accelerated else None
+        self._np = None
+        if self._audioop is None:
+            self._np = lazy_import('numpy')
+            self._resize(max_frames)
+        self.last_reading = SILENT_READING
+    @property
+    def implementation(self) -> str:
+        return 'numpy' if self._audioop is None else 'audioop'
+    def _resize(self, count: int):
+        np = self._np
+        scratch = np.zeros(count, dtype=np.float32)
+        self._frames = count
+        self._ops = (np.frombuffer, np.dtype(np.int16), np.copyto, scratch, scratch.dot, scratch.argmax, scratch.argmin, scratch.item)
+    def process(self, buffer) -> MeterReading:
+        audioop = self._audioop
+        if audioop is None:
+            return self._process_array(buffer)
+        if not buffer:
+            return self.last_reading
+        try:
+            peak, rms = audioop.max(buffer, 2) / FULL_SCALE, audioop.rms(buffer, 2) / FULL_SCALE
+        except audioop.error:
+            view = memoryview(buffer).cast('B')
+            return self.process(view[:len(view) & ~1])
+        dbfs = 20.0 * math.log10(rms) if rms > SILENCE_RMS else SILENCE_DBFS
+        self.last_reading = reading = MeterReading._make((peak, rms, dbfs, int(peak * 100)))
+        return reading
+    def _process_array(self, buffer) -> MeterReading:
+        frombuffer, dtype, copyto, scratch, dot, argmax, argmin, item = self._ops
+        try:
+            samples = frombuffer(buffer, dtype)
+        except ValueError:
+            samples = frombuffer(buffer, dtype, memoryview(buffer).nbytes >> 1)
+        count = len(samples)
+        if count != self._frames:
+            if count == 0:
+                return self.last_reading
+            self._resize(count)
+            return self._process_array(samples)
+        copyto(scratch, samples)
+        energy = float(dot(scratch))
+        high, low = item(argmax()), -item(argmin())
+        peak, rms = (high if high >= low else low) / FULL_SCALE, math.sqrt(energy / count) / FULL_SCALE
+        dbfs = 20.0 * math.log10(rms) if rms > SILENCE_RMS else SILENCE_DBFS
+        self.last_reading = reading = MeterReading._make((peak, rms, dbfs, int(peak * 100)))
+        return reading
+
+class LevelPacer:
+    def __init__(self, max_rate: float = 20.0, threshold: int = 1):
+        self.max_rate = max(1.0, float(max_rate))
+        self.threshold = max(0, int(threshold))
+        self.displayed = None
+        self.pushed = 0
+        self.delivered = 0
+        self._pending = None
+        self._lock = Lock()
+    @property
+    def interval_ms(self) -> int:
+        return max(1, int(1000 / self.max_rate))
+    def push(self, level: int):
+        with self._lock:
+            self.pushed += 1
+            if self._pending is None or level > self._pending:
+                self._pending = level
+    def take(self):
+        with self._lock:
+            level, self._pending = self._pending, None
+        if level is None:
+            return None
+        if self.displayed is not None and abs(level - self.displayed) < self.threshold:
+            return None
+        self.displayed = level
+        self.delivered += 1
+        return level
+    def discard(self):
+        with self._lock:
+            self._pending = None
+        self.displayed = None
+
+@dataclass(frozen=True)
+class CaptureFormat:
+    rate: int
+    channels: int
+    chunk: int
+    @property
+    def chunk_seconds(self) -> float:
+        return self.chunk / self.rate
+
+@dataclass
+class CaptureStats:
+    chunks: int = 0
+    frames: int = 0
+    overflows: int = 0
+    dropped_frames: int = 0
+    restarts: int = 0
+    chunk_changes: int = 0
+    jitter_ms: float = 0.0
+
+class CaptureSource:
+    name = 'abstract'
+    def negotiate(self, rate: int, channels: int) -> tuple:
+        return rate or 44100, channels
+    def open(self, fmt: CaptureFormat, callback):
+        raise NotImplementedError
+    def start(self):
+        raise NotImplementedError
+    def stop(self):
+        raise NotImplementedError
+    def is_active(self) -> bool:
+        raise NotImplementedError
+    def close(self):
+        pass
+
+class PyAudioCaptureSource(CaptureSource):
+    name = 'pyaudio'
+    FALLBACK_RATES = (48000, 44100, 32000, 16000)
+    def __init__(self):
+        self.pyaudio = lazy_import('pyaudio')
+        self._audio = None
+        self._stream = None
+    def _ensure_audio(self):
+        if self._audio is None:
+            self._audio = self.pyaudio.PyAudio()
+        return self._audio
+    def negotiate(self, rate: int, channels: int) -> tuple:
+        audio = self._ensure_audio()
+        info = audio.get_default_input_device_info()
+        native_rate = int(info.get('defaultSampleRate') or 44100)
+        channels = max(1, min(channels, int(info.get('maxInputChannels') or 1)))
+        for candidate in ((rate,) if rate else ()) + (native_rate,) + self.FALLBACK_RATES:
+            try:
+                if audio.is_format_supported(candidate, input_device=info['index'], input_channels=channels,
+                                             input_format=self.pyaudio.paInt16):
+                    return candidate, channels
+            except ValueError:
+                continue
+        return native_rate, channels
+    def open(self, fmt: CaptureFormat, callback):
+        overflow_flag = self.pyaudio.paInputOverflow
+        def on_audio(in_data, frame_count, time_info, status):
+            adc_time = time_info.get('input_buffer_adc_time', 0.0) if time_info else 0.0
+            keep = callback(in_data, frame_count, adc_time, bool(status & overflow_flag))
+            return (None, self.pyaudio.paContinue if keep else self.pyaudio.paComplete)
+        self._stream = self._ensure_audio().open(format=self.pyaudio.paInt16,
+                                                 channels=fmt.channels,
+                                                 rate=fmt.rate,
+                                                 input=True,
+                                                 frames_per_buffer=fmt.chunk,
+                                                 start=False,
+                                                 stream_callback=on_audio)
+    def start(self):
+        self._stream.start_stream()
+    def stop(self):
+        if self._stream is not None and self._stream.is_active():
+            self._stream.stop_stream()
+    def is_active(self) -> bool:
+        return self._stream is not None and self._stream.is_active()
+    def close(self):
+        if self._stream is not None:
+            self.stop()
+            self._stream.close()
+            self._stream = None
+        if self._audio is not None:
+            self._audio.terminate()
+            self._audio = None
+
+class SyntheticCaptureSource(CaptureSource):
+    name = 'synthetic'
+    def __init__(self, native_rate: int = 48000, frequency: float = 440.0, amplitude: float = 0.3,
+                 jitter_ms: float = 0.0, overflow_every: int = 0, fail_opens: int = 0, fail_after: int = 0,
+                 realtime: bool = True):
+        self.native_rate = native_rate
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.jitter_ms = jitter_ms
+        self.overflow_every = overflow_every
+        self.fail_opens = fail_opens
+        self.fail_after = fail_after
+        self.realtime = realtime
+        self.opens = 0
+        self.delivered = 0
+        self._fmt = None
+        self._callback = None
+        self._thread = None
+        self._active = False
+    def negotiate(self, rate: int, channels: int) -> tuple:
+        return rate or self.native_rate, channels
+    def open(self, fmt: CaptureFormat, callback):
+        if self.fail_opens > 0:
+            self.fail_opens -= 1
+            raise OSError("synthetic capture device unavailable")
+        self.opens += 1
+        self._fmt = fmt
+        self._callback = callback
+    def generate(self, start_frame: int, fmt: CaptureFormat) -> bytes:
+        np = lazy_import('numpy')
+        t = (np.arange(fmt.chunk) + start_frame) / fmt.rate
+        wave = (np.sin(2 * math.pi * self.frequency * t) * self.amplitude * (FULL_SCALE - 1)).astype(np.int16)
+        return np.repeat(wave, fmt.channels).tobytes()
+    def _run(self):
+        fmt = self._fmt
+        rng = lazy_import('numpy').random.default_rng(0)
+        frame = 0
+        count = 0
+        clock = time.monotonic()
+        while self._active:
+            if self.realtime:
+                clock += fmt.chunk_seconds
+                delay = clock - time.monotonic() + (rng.uniform(0, self.jitter_ms) / 1000.0 if self.jitter_ms else 0.0)
+                if delay > 0:
+                    time.sleep(delay)
+            count += 1
+            self.delivered += 1
+            overflow = bool(self.overflow_every) and self.delivered % self.overflow_every == 0
+            if overflow:
+                frame += fmt.chunk
+            keep = self._callback(self.generate(frame, fmt), fmt.chunk, frame / fmt.rate, overflow)
+            frame += fmt.chunk
+            if not keep or (self.fail_after and count >= self.fail_after):
+                self._active = False
+    def start(self):
+        self._active = True
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+    def stop(self):
+        self._active = False
+        if self._thread is not None and self._thread is not current_thread():
+            self._thread.join()
+        self._thread = None
+    def is_active(self) -> bool:
+        return self._active
+    def close(self):
+        self.stop()
+
+def create_capture_source(name: str = None) -> CaptureSource:
+    name = name or os.environ.get('MICMASTER_CAPTURE') or 'pyaudio'
+    if name == 'pyaudio':
+        return PyAudioCaptureSource()
+    if name == 'synthetic':
+        return SyntheticCaptureSource()
+    raise ValueError(f"Unknown capture source: {name}")
+
+class ProcessSource:
+    def pids(self) -> set:
+        raise NotImplementedError
+    def name(self, pid: int):
+        raise NotImplementedError
+
+class PsutilProcessSource(ProcessSource):
+    def __init__(self):
+        self.psutil = lazy_import('psutil')
+    def pids(self) -> set:
+        return set(self.psutil.pids())
+    def name(self, pid: int):
+        psutil = self.psutil
+        try:
+            return psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+class SyntheticProcessSource(ProcessSource):
+    def __init__(self, processes: dict = None):
+        self.processes = dict(processes or {})
+        self.name_calls = 0
+        self._next_pid = max(self.processes, default=0) + 1
+    @classmethod
+    def generate(cls, count: int, names: list = None):
+        names = names or [f"process{i % 500}.exe" for i in range(count)]
+        return cls({pid: names[pid % len(names)] for pid in range(1, count + 1)})
+    def pids(self) -> set:
+        return set(self.processes)
+    def name(self, pid: int):
+        self.name_calls += 1
+        return self.processes.get(pid)
+    def spawn(self, name: str) -> int:
+        pid = self._next_pid
+        self._next_pid += 1
+        self.processes[pid] = name
+        return pid
+    def kill(self, pid: int):
+        self.processes.pop(pid, None)
+
+class ProcessIndex:
+    def __init__(self):
+        self._names_by_pid = {}
+        self._counts = {}
+        self._display = {}
+        self._lock = Lock()
+        self._update_lock = Lock()
+    def update(self, source: ProcessSource, on_batch=None, batch_size: int = 200) -> bool:
+        with self._update_lock:
+            pids = source.pids()
+            with self._lock:
+                started = list(pids - self._names_by_pid.keys())
+                exited = self._names_by_pid.keys() - pids
+                for pid in exited:
+                    self._remove(pid)
+            for i in range(0, len(started), batch_size):
+                resolved = {pid: source.name(pid) for pid in started[i:i + batch_size]}
+                with self._lock:
+                    added = [name for pid, name in resolved.items() if self._add(pid, name)]
+                if on_batch and added:
+                    on_batch(added)
+            return bool(started or exited)
+    def _add(self, pid: int, name) -> bool:
+        self._names_by_pid[pid] = name
+        if not name:
+            return False
+        key = name.lower()
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        if count == 0:
+            self._display[key] = name
+            return True
+        return False
+    def _remove(self, pid: int):
+        name = self._names_by_pid.pop(pid, None)
+        if not name:
+            return
+        key = name.lower()
+        remaining = self._counts.get(key, 0) - 1
+        if remaining > 0:
+            self._counts[key] = remaining
+        else:
+            self._counts.pop(key, None)
+            self._display.pop(key, None)
+    def names(self) -> list:
+        with self._lock:
+            return sorted(self._display.values(), key=str.lower)
+    def count(self, name: str) -> int:
+        return self._counts.get(name.lower(), 0)
+    def __len__(self) -> int:
+        return len(self._names_by_pid)
+
+class ProcessWatcher(Thread):
+    def __init__(self, callback, source: ProcessSource = None, index: ProcessIndex = None,
+                 min_interval: float = 1.0, max_interval: float = 8.0):
+        super().__init__()
+        self.daemon = True
+        self.callback = callback
+        self.source = source or PsutilProcessSource()
+        self.index = index if index is not None else ProcessIndex()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.apps = frozenset()
+        self.active = False
+        self.running = True
+        self._wake = Event()
+    def set_apps(self, apps: list):
+        self.apps = frozenset(app.lower() for app in apps)
+        if not self.apps:
+            self.active = False
+        self.interval = self.min_interval
+        self._wake.set()
+    def poll(self) -> bool:
+        apps = self.apps
+        if not apps:
+            return False
+        changed = self.index.update(self.source)
+        active = any(self.index.count(app) for app in apps)
+        if active != self.active:
+            self.active = active
+            self.callback(active)
+        return changed
+    def run(self):
+        while self.running:
+            try:
+                changed = self.poll()
+            except Exception as e:
+                automute_log.error(f"Error checking auto-mute: {e}")
+                changed = False
+            self.interval = self.min_interval if changed else min(self.max_interval, self.interval * 1.5)
+            self._wake.wait(self.interval if self.apps else None)
+            self._wake.clear()
+    def stop(self):
+        self.running = False
+        self._wake.set()
+
+class SettingsStore(Thread):
+    def __init__(self, path: str, serialize, delay: float = 0.5, on_error=None):
+        super().__init__()
+        self.daemon = True
+        self.path = path
+        self.serialize = serialize
+        self.delay = delay
+        self.on_error = on_error
+        self.running = True
+        self.writes = 0
+        self.dirty = set()
+        self._pending = None
+        self._deadline = 0.0
+        self._sequence = 0
+        self._written_sequence = 0
+        self._condition = Condition()
+        self._write_lock = Lock()
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    def mark_dirty(self, *keys):
+        snapshot = self.serialize()
+        with self._condition:
+            self._sequence += 1
+            self.dirty.update(keys or ('*',))
+            self._pending = (self._sequence, snapshot)
+            self._deadline = time.monotonic() + self.delay
+            self._condition.notify()
+    def _take(self):
+        pending, keys = self._pending, self.dirty
+        self._pending = None
+        self.dirty = set()
+        return pending, keys
+    def run(self):
+        while True:
+            with self._condition:
+                while self.running and (self._pending is None or time.monotonic() < self._deadline):
+                    self._condition.wait(None if self._pending is None else max(0.0, self._deadline - time.monotonic()))
+                if not self.running:
+                    return
+                pending, keys = self._take()
+            self._write(pending, keys)
+    def _write(self, pending, keys: set):
+        if pending is None:
+            return
+        sequence, data = pending
+        with self._write_lock:
+            if sequence <= self._written_sequence:
+                return
+            temp_path = f"{self.path}.tmp"
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+                self._written_sequence = sequence
+                self.writes += 1
+                settings_log.info(f"Settings saved ({', '.join(sorted(keys))}).")
+            except Exception as e:
+                settings_log.error(f"Error saving settings: {e}")
+                if self.on_error:
+                    self.on_error(str(e))
+    def flush(self):
+        with self._condition:
+            pending, keys = self._take()
+        self._write(pending, keys)
+    def close(self):
+        with self._condition:
+            self.running = False
+            self._condition.notify()
+        self.flush()
+
+class Profile:
+    DEFAULTS = {
+        'volume': 100,
+        'startup': False,
+        'notifications': False,
+        'sound_notifications': False,
+        'theme': 'Dark',
+        'enable_auto_mute': False,
+        'auto_mute_apps': [],
+        'tray_enabled': False,
+        'create_desktop_shortcut': False,
+        'hotkey': None,
+        'hotkey_mode': 'toggle',
+        'bindings': {},
+        'mute_fade_ms': 0,
+        'capture_chunk': 1024,
+        'capture_rate': 0,
+        'capture_latency_ms': 100,
+        'vad_enabled': False,
+        'vad_silence_seconds': 30,
+        'vad_threshold_db': -45
+    }
+    RANGES = {
+        'mute_fade_ms': (0, 2000),
+        'capture_chunk': (128, 8192),
+        'capture_rate': (0, 192000),
+        'capture_latency_ms': (10, 1000),
+        'vad_silence_seconds': (1, 3600),
+        'vad_threshold_db': (-80, -10)
+    }
+    CHOICES = {
+        'hotkey_mode': ('toggle', 'hold')
+    }
+    __slots__ = tuple(DEFAULTS) + ('extra',)
+    def __init__(self, **values):
+        self.extra = {}
+        self.reset()
+        for key, value in values.items():
+            self.set(key, value)
+    def reset(self):
+        for key, default in self.DEFAULTS.items():
+            setattr(self, key, type(default)(default) if isinstance(default, (list, dict)) else default)
+    @staticmethod
+    def validate(key: str, value):
+        default = Profile.DEFAULTS[key]
+        if key == 'volume' or key in Profile.RANGES:
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                raise ValueError(f"expected a number, got {value!r}")
+            low, high = Profile.RANGES.get(key, (0, 100))
+            return min(high, max(low, int(value)))
+        if key in Profile.CHOICES:
+            if value not in Profile.CHOICES[key]:
+                raise ValueError(f"expected one of {', '.join(Profile.CHOICES[key])}, got {value!r}")
+            return value
+        if key == 'bindings':
+            if not isinstance(value, dict):
+                raise ValueError(f"expected an object, got {value!r}")
+            bindings = {}
+            for hotkey, action in value.items():
+                try:
+                    if not isinstance(hotkey, str) or not isinstance(action, str) or action not in HOTKEY_ACTIONS:
+                        raise ValueError(f"unknown action {action!r}")
+                    parse_hotkey(hotkey)
+                except ValueError as e:
+                    settings_log.warning(f"Ignoring hotkey binding {hotkey!r}: {e}.")
+                    continue
+                bindings[hotkey] = action
+            return bindings
+        if key == 'theme':
+            if value not in THEMES:
+                raise ValueError(f"unknown theme {value!r}")
+            return value
+        if key == 'auto_mute_apps':
+            if not isinstance(value, list) or not all(isinstance(app, str) for app in value):
+                raise ValueError(f"expected a list of names, got {value!r}")
+            return list(value)
+        if key == 'hotkey':
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"expected a string, got {value!r}")
+            return value or None
+        if isinstance(default, bool):
+            if not isinstance(value, (bool, int)):
+                raise ValueError(f"expected a boolean, got {value!r}")
+            return bool(value)
+        return value
+    def set(self, key: str, value):
+        setattr(self, key, self.validate(key, value))
+    @classmethod
+    def from_dict(cls, data, name: str = '') -> 'Profile':
+        profile = cls()
+        if not isinstance(data, dict):
+            settings_log.warning(f"Profile '{name}' is malformed; using defaults.")
+            return profile
+        for key, value in data.items():
+            if key not in cls.DEFAULTS:
+                profile.extra[key] = value
+                continue
+            try:
+                profile.set(key, value)
+            except (ValueError, TypeError, OverflowError) as e:
+                settings_log.warning(f"Profile '{name}': invalid '{key}' ({e}); using default.")
+        return profile
+    def to_dict(self) -> dict:
+        data = dict(self.extra)
+        for key in self.DEFAULTS:
+            value = getattr(self, key)
+            data[key] = type(value)(value) if isinstance(value, (list, dict)) else value
+        return data
+    def copy(self) -> 'Profile':
+        return Profile.from_dict(self.to_dict())
+    def diff(self, other) -> set:
+        if other is None:
+            return set(self.DEFAULTS)
+        return {key for key in self.DEFAULTS if getattr(self, key) != getattr(other, key)}
+
+def migrate_settings_v1(settings: dict) -> dict:
+    profiles = settings.get('profiles')
+    if not isinstance(profiles, dict):
+        profiles = {}
+    settings['profiles'] = {str(name): data for name, data in profiles.items()}
+    current = settings.get('current_profile', 0)
+    settings['current_profile'] = current if isinstance(current, int) and not isinstance(current, bool) else 0
+    return settings
+
+SETTINGS_MIGRATIONS = {
+    1: migrate_settings_v1
+}
+
+def migrate_settings(settings) -> dict:
+    if not isinstance(settings, dict):
+        raise ValueError("Settings file does not contain an object.")
+    version = settings.get('schema_version', 1)
+    if not isinstance(version, int) or version > SETTINGS_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported settings schema version: {version!r}")
+    while version < SETTINGS_SCHEMA_VERSION:
+        settings = SETTINGS_MIGRATIONS[version](settings)
+        version += 1
+        settings_log.info(f"Settings migrated to schema version {version}.")
+    settings['schema_version'] = SETTINGS_SCHEMA_VERSION
+    return settings
+
+class LatencyHistogram:
+    def __init__(self, min_ms: float = 0.01, max_ms: float = 60000.0, growth: float = 1.1):
+        self.bounds = []
+        bound = min_ms
+        while bound < max_ms:
+            self.bounds.append(bound)
+            bound *= growth
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    def record(self, ms: float):
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = q / 100.0 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return min(self.max, self.bounds[index]) if index < len(self.bounds) else self.max
+        return self.max
+    def summary(self) -> dict:
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max
+        }
+    def to_dict(self) -> dict:
+        data = self.summary()
+        data['buckets'] = [{'le_ms': self.bounds[i] if i < len(self.bounds) else None, 'count': count}
+                           for i, count in enumerate(self.counts) if count]
+        return data
+
+class LatencyTrace:
+    __slots__ = ('source', 'stamps')
+    def __init__(self, source: str):
+        self.source = source
+        self.stamps = [(source, time.perf_counter_ns())]
+    def mark(self, stage: str):
+        self.stamps.append((stage, time.perf_counter_ns()))
+
+class LatencyTracker:
+    def __init__(self):
+        self.histograms = {}
+        self._lock = Lock()
+    def start(self, source: str) -> LatencyTrace:
+        return LatencyTrace(source)
+    def finish(self, trace: LatencyTrace):
+        stamps = trace.stamps
+        with self._lock:
+            for (previous, start), (stage, end) in zip(stamps, stamps[1:]):
+                self._record(f"{trace.source}: {previous} -> {stage}", (end - start) / 1e6)
+            for stage, end in stamps:
+                if stage == 'muted':
+                    self._record(f"{trace.source}: total to mute", (end - stamps[0][1]) / 1e6)
+    def record(self, name: str, ms: float):
+        with self._lock:
+            self._record(name, ms)
+    def _record(self, name: str, ms: float):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.record(ms)
+    def summary(self) -> dict:
+        with self._lock:
+            return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                'version': VERSION,
+                'clock': 'perf_counter_ns',
+                'histograms': {name: histogram.to_dict() for name, histogram in sorted(self.histograms.items())}
+            }
+    def export(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+class AudioEndpointWorker(Thread):
+    KINDS = ('open', 'mute', 'mute_all', 'volume', 'select', 'devices', 'state')
+    DRAINED = ('mute', 'mute_all', 'volume')
+    def __init__(self, backend: MicBackend, on_complete=None):
+        super().__init__()
+        self.daemon = True
+        self.backend = backend
+        self.on_complete = on_complete
+        self.running = True
+        self.submitted = 0
+        self.executed = 0
+        self.last_executed = {}
+        self._pending = {}
+        self._deadline = None
+        self._condition = Condition()
+    def busy(self, kind: str, settle: float = 0.25) -> bool:
+        with self._condition:
+            return kind in self._pending or time.monotonic() - self.last_executed.get(kind, float('-inf')) < settle
+    def submit(self, kind: str, value=None, trace: LatencyTrace = None):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown endpoint command: {kind}")
+        with self._condition:
+            self.submitted += 1
+            traces = self._pending.pop(kind)[1] if kind in self._pending else []
+            if kind == 'mute_all' and 'mute' in self._pending:
+                traces = self._pending.pop('mute')[1] + traces
+            if trace is not None:
+                traces.append(trace)
+            self._pending[kind] = (value, traces)
+            self._condition.notify()
+    def _take(self):
+        kind = next(iter(self._pending))
+        value, traces = self._pending.pop(kind)
+        return kind, value, traces
+    def run(self):
+        while True:
+            with self._condition:
+                while self.running and not self._pending:
+                    self._condition.wait()
+                if not self.running and (not self._pending or time.monotonic() > self._deadline):
+                    break
+                kind, value, traces = self._take()
+            result, error = None, None
+            try:
+                result = self.execute(kind, value)
+            except Exception as e:
+                error = e
+            with self._condition:
+                self.last_executed[kind] = time.monotonic()
+            for trace in traces:
+                trace.mark('muted' if kind in ('mute', 'mute_all') else kind)
+            if self.on_complete:
+                self.on_complete(kind, result, error, traces)
+        try:
+            self.backend.close()
+        except Exception as e:
+            mic_log.error(f"Error closing microphone backend: {e}")
+    def execute(self, kind: str, value):
+        self.executed += 1
+        if kind == 'open':
+            if not self.backend.open():
+                return None
+            return self.backend.snapshot()
+        if not self.backend.available:
+            return None
+        if kind == 'mute':
+            self.backend.set_mute(value)
+        elif kind == 'mute_all':
+            return self.backend.set_mute_all(value)
+        elif kind == 'volume':
+            self.backend.set_volume(value)
+        elif kind == 'select':
+            self.backend.select_endpoint(value)
+            return self.backend.snapshot()
+        elif kind == 'state':
+            return self.backend.snapshot()
+        else:
+            self.backend.apply_device_changes()
+            return self.backend.snapshot()
+        return value
+    def stop(self, timeout: float = 2.0):
+        with self._condition:
+            self.running = False
+            self._pending = {kind: pending for kind, pending in self._pending.items() if kind in self.DRAINED}
+            self._deadline = time.monotonic() + timeout
+            self._condition.notify()
+        if self.is_alive():
+            self.join(timeout + 1.0)
+
+class VolumeController(Thread):
+    def __init__(self, submit, max_rate: float = 30.0, ramp_rate: float = 60.0):
+        super().__init__()
+        self.daemon = True
+        self.submit = submit
+        self.interval = 1.0 / max(1.0, float(max_rate))
+        self.ramp_interval = 1.0 / max(1.0, float(ramp_rate))
+        self.running = True
+        self.level = None
+        self.requests = 0
+        self.writes = 0
+        self._target = None
+        self._force = False
+        self._ramp = None
+        self._last_write = 0.0
+        self._condition = Condition()
+    def request(self, level: float, force: bool = False):
+        with self._condition:
+            self.requests += 1
+            self._target = level
+            self._force = self._force or force
+            self._condition.notify()
+    def commit(self, level: float):
+        self.request(level, force=True)
+    def sync(self, level: float):
+        with self._condition:
+            self.level = level
+            self._target = None
+    def cancel(self):
+        with self._condition:
+            self._ramp = None
+    def busy(self, settle: float = 0.25) -> bool:
+        with self._condition:
+            return self._ramp is not None or self._target is not None or time.monotonic() - self._last_write < settle
+    def ramp(self, start: float, end: float, duration: float, on_start=None, on_done=None):
+        with self._condition:
+            self._ramp = (start, end, time.monotonic(), max(0.0, duration), on_start, on_done)
+            self._condition.notify()
+    def _write(self, level: float):
+        if level == self.level:
+            return
+        self.level = level
+        self.writes += 1
+        self._last_write = time.monotonic()
+        self.submit(level)
+    def run(self):
+        while True:
+            on_start = on_done = None
+            with self._condition:
+                while self.running and self._target is None and self._ramp is None:
+                    self._condition.wait()
+                if not self.running:
+                    return
+                now = time.monotonic()
+                if self._ramp is not None:
+                    start, end, started, duration, on_start, on_done = self._ramp
+                    progress = 1.0 if duration <= 0 else min(1.0, (now - started) / duration)
+                    level = start + (end - start) * progress
+                    if progress < 1.0:
+                        self._ramp = (start, end, started, duration, None, on_done)
+                        on_done = None
+                    else:
+                        self._ramp = None
+                    wait = self.ramp_interval if self._ramp else 0.0
+                else:
+                    wait = self._last_write + self.interval - now
+                    if wait > 0 and not self._force:
+                        self._condition.wait(wait)
+                        continue
+                    level, self._target, self._force = self._target, None, False
+                    wait = 0.0
+            self._write(level)
+            if on_start:
+                on_start()
+            if on_done:
+                on_done()
+            if wait > 0:
+                with self._condition:
+                    if self.running:
+                        self._condition.wait(wait)
+    def stop(self, timeout: float = 1.0):
+        with self._condition:
+            self.running = False
+            self._condition.notify()
+        if self.is_alive():
+            self.join(timeout)
+        with self._condition:
+            ramp, self._ramp = self._ramp, None
+        if ramp is not None:
+            start, end, started, duration, on_start, on_done = ramp
+            self._write(end)
+            if on_start:
+                on_start()
+            if on_done:
+                on_done()
+        with self._condition:
+            target, self._target = self._target, None
+        if target is not None:
+            self._write(target)
+
+def create_backend(name: str = None, latency_ms: float = None) -> MicBackend:
+    name = name or os.environ.get('MICMASTER_BACKEND') or ('pycaw' if sys.platform == 'win32' else 'fake')
+    if name == 'pycaw':
+        return PycawBackend()
+    if name == 'fake':
+        if latency_ms is None:
+            latency_ms = float(os.environ.get('MICMASTER_FAKE_LATENCY_MS', 0))
+        return FakeMicBackend(latency=latency_ms / 1000.0)
+    raise ValueError(f"Unknown microphone backend: {name}")
+
+def benchmark_backend(args) -> dict:
+    backend = create_backend(args.backend, args.latency_ms)
+    if not backend.open():
+        raise RuntimeError("No microphone found.")
+    muted = backend.get_mute()
+    samples = []
+    for _ in range(args.iterations):
+        muted = not muted
+        start = time.perf_counter()
+        backend.set_mute(muted)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    samples.sort()
+    return {
+        'backend': backend.name,
+        'iterations': len(samples),
+        'mean_ms': sum(samples) / len(samples) if samples else 0.0,
+        'p50_ms': percentile(samples, 50),
+        'p95_ms': percentile(samples, 95),
+        'p99_ms': percentile(samples, 99),
+        'max_ms': samples[-1] if samples else 0.0
+    }
+
+def benchmark_endpoint(args) -> dict:
+    backend = create_backend(args.backend, args.latency_ms)
+    done = Event()
+    def on_complete(kind, result, error, traces):
+        if error is not None:
+            raise error
+        if kind == 'volume' and result == 1.0:
+            done.set()
+    worker = AudioEndpointWorker(backend, on_complete)
+    worker.start()
+    worker.submit('open')
+    samples = []
+    muted = False
+    for i in range(args.iterations):
+        muted = not muted
+        start = time.perf_counter()
+        worker.submit('mute', muted)
+        worker.submit('volume', (i % 100) / 100.0)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    worker.submit('volume', 1.0)
+    done.wait(60)
+    worker.stop()
+    samples.sort()
+    return {
+        'backend': backend.name,
+        'submitted': worker.submitted,
+        'executed': worker.executed,
+        'submit_p50_ms': percentile(samples, 50),
+        'submit_p99_ms': percentile(samples, 99),
+        'submit_max_ms': samples[-1] if samples else 0.0
+    }
+
+def benchmark_devices(args) -> dict:
+    backend = create_backend(args.backend, args.latency_ms)
+    if isinstance(backend, FakeMicBackend):
+        backend.endpoints = [AudioEndpoint(f'fake-capture-{i}', f'Fake Microphone {i}', i == 0) for i in range(4)]
+    if not backend.open():
+        raise RuntimeError("No microphone found.")
+    endpoint_ids = [endpoint.id for endpoint in backend.list_endpoints()]
+    cached, rebind, mute_all = [], [], []
+    try:
+        for i in range(args.iterations):
+            endpoint_id = endpoint_ids[i % len(endpoint_ids)]
+            start = time.perf_counter()
+            backend.select_endpoint(endpoint_id)
+            backend.set_mute(backend.get_mute())
+            cached.append((time.perf_counter() - start) * 1000.0)
+            start = time.perf_counter()
+            backend.enumerate_endpoints()
+            handle = backend.activate(endpoint_id)
+            backend._set_mute(handle, backend._get_mute(handle))
+            rebind.append((time.perf_counter() - start) * 1000.0)
+            start = time.perf_counter()
+            backend.set_mute_all(backend.get_mute())
+            mute_all.append((time.perf_counter() - start) * 1000.0)
+    finally:
+        activations = backend.devices.activations
+        backend.close()
+    cached.sort()
+    rebind.sort()
+    mute_all.sort()
+    return {
+        'backend': backend.name,
+        'endpoints': len(endpoint_ids),
+        'iterations': len(cached),
+        'activations': activations,
+        'switch_p50_ms': percentile(cached, 50),
+        'switch_p99_ms': percentile(cached, 99),
+        'rebind_p50_ms': percentile(rebind, 50),
+        'rebind_p99_ms': percentile(rebind, 99),
+        'mute_all_p50_ms': percentile(mute_all, 50),
+        'mute_all_p99_ms': percentile(mute_all, 99)
+    }
+
+def benchmark_volume(args) -> dict:
+    backend = create_backend(args.backend, args.latency_ms)
+    done = Event()
+    def on_complete(kind, result, error, traces):
+        if kind == 'volume' and (error is not None or result == 0.5):
+            done.set()
+    worker = AudioEndpointWorker(backend, on_complete)
+    worker.start()
+    worker.submit('open')
+    controller = VolumeController(lambda level: worker.submit('volume', level))
+    controller.sync(1.0)
+    controller.start()
+    start = time.perf_counter()
+    for i in range(args.iterations):
+        controller.request(1.0 - (i % 101) / 100.0)
+        time.sleep(0.001)
+    controller.commit(0.5)
+    elapsed = time.perf_counter() - start
+    done.wait(10)
+    controller.stop()
+    worker.stop()
+    return {
+        'backend': backend.name,
+        'requests': controller.requests,
+        'controller_writes': controller.writes,
+        'backend_writes': worker.executed - 1,
+        'drag_seconds': elapsed
+    }
+
+def benchmark_metering(args) -> dict:
+    import tracemalloc
+    np = lazy_import('numpy')
+    chunk = np.random.default_rng(0).integers(-32768, 32768, size=1024, dtype=np.int16).tobytes()
+    engine = MeteringEngine(1024)
+    def legacy(data):
+        audio_data = np.frombuffer(data, dtype=np.int16)
+        return int((np.abs(audio_data).max() / 32768) * 100)
+    result = {'iterations': args.iterations, 'chunk_frames': 1024, 'engine_implementation': engine.implementation}
+    candidates = [('legacy', legacy), ('engine', engine.process)]
+    if engine.implementation != 'numpy':
+        candidates.append(('engine_numpy', MeteringEngine(1024, accelerated=False).process))
+    for label, func in candidates:
+        func(chunk)
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            func(chunk)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(100):
+            func(chunk)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+        result[f'{label}_us_per_chunk'] = elapsed / max(1, args.iterations) * 1e6
+        result[f'{label}_peak_alloc_bytes'] = peak
+    return result
+
+def benchmark_capture(args) -> dict:
+    source = SyntheticCaptureSource(jitter_ms=args.jitter_ms, overflow_every=200, fail_opens=1)
+    pacer = LevelPacer()
+    thread = AudioStreamThread(pacer, source, chunk=256, max_latency_ms=100.0, min_backoff=0.1)
+    thread.adapt_interval = 0.5
+    thread.start()
+    thread.add_consumer('benchmark')
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    time.sleep(args.seconds)
+    cpu = time.process_time() - cpu_start
+    elapsed = time.perf_counter() - start
+    thread.stop()
+    thread.join()
+    stats = thread.stats
+    return {
+        'source': source.name,
+        'seconds': elapsed,
+        'rate': thread.format.rate if thread.format else None,
+        'initial_chunk': 256,
+        'final_chunk': thread.format.chunk if thread.format else None,
+        'chunks': stats.chunks,
+        'overflows': stats.overflows,
+        'dropped_frames': stats.dropped_frames,
+        'chunk_changes': stats.chunk_changes,
+        'opens': thread.opens,
+        'jitter_ms': stats.jitter_ms,
+        'levels_pushed': pacer.pushed,
+        'cpu_percent': cpu / elapsed * 100.0
+    }
+
+def benchmark_analysis(args) -> dict:
+    from queue import Queue
+    result = {'analysis_load': args.analysis_load, 'seconds': args.seconds}
+    for mode in ('thread', 'process'):
+        if mode == 'thread':
+            capture = AudioStreamThread(LevelPacer(), SyntheticCaptureSource(), analyzer=SpectrumAnalyzer(load=args.analysis_load))
+        else:
+            capture = AnalysisProcess(LevelPacer(), 'synthetic', load=args.analysis_load)
+        capture.start()
+        capture.add_consumer('benchmark')
+        time.sleep(1.0)
+        tracker = LatencyTracker()
+        delivered = Queue()
+        source = FakeInputSource()
+        dispatcher = HotkeyDispatcher(lambda action, trace: delivered.put(trace), source, debounce=0, tracker=tracker)
+        dispatcher.bind({'ctrl+m': 'toggle_mute'})
+        presses = max(1, int(args.seconds / 0.005))
+        def hook():
+            for _ in range(presses):
+                source.press('ctrl+m')
+                time.sleep(0.005)
+        cpu_start = time.process_time()
+        presser = Thread(target=hook, daemon=True)
+        presser.start()
+        for _ in range(presses):
+            trace = delivered.get()
+            trace.mark('delivered')
+            tracker.finish(trace)
+        presser.join()
+        cpu = time.process_time() - cpu_start
+        capture.poll()
+        capture.stop()
+        capture.join()
+        stats = tracker.summary()['hotkey: hotkey -> delivered']
+        result[mode] = {
+            'hotkey_p50_ms': stats['p50_ms'],
+            'hotkey_p99_ms': stats['p99_ms'],
+            'hotkey_max_ms': stats['max_ms'],
+            'gui_process_cpu_percent': cpu / args.seconds * 100.0
+        }
+    return result
+
+def benchmark_hotkeys(args) -> dict:
+    import random
+    rng = random.Random(0)
+    letters = 'abcdefghijklmnopqrstuvwxyz '
+    stream = []
+    for i in range(args.iterations):
+        if i % 50 == 49:
+            stream += [('down', 'ctrl'), ('down', 'k'), ('up', 'k'), ('down', 'm'), ('up', 'm'), ('up', 'ctrl')]
+        elif i % 50 == 24:
+            stream += [('down', 'f9'), ('down', 'f9'), ('down', 'f9'), ('up', 'f9')]
+        else:
+            key = rng.choice(letters)
+            stream += [('down', 'space' if key == ' ' else key), ('up', 'space' if key == ' ' else key)]
+    delivered = []
+    dispatcher = HotkeyDispatcher(lambda action, trace: delivered.append(action), FakeInputSource(), debounce=0)
+    dispatcher.bind({'ctrl+k, ctrl+m': 'toggle_mute', 'f9': 'push_to_talk', 'ctrl+alt+m': 'toggle_mute'})
+    events = [KeyEvent(event_type, name) for event_type, name in stream]
+    samples = []
+    for event in events:
+        start = time.perf_counter_ns()
+        dispatcher.on_event(event)
+        samples.append(time.perf_counter_ns() - start)
+    start = time.perf_counter()
+    for event in events:
+        dispatcher.on_event(event)
+    elapsed = time.perf_counter() - start
+    dispatcher.close()
+    samples.sort()
+    return {
+        'events': len(events),
+        'actions': len(delivered),
+        'per_event_mean_us': elapsed / len(events) * 1e6 if events else 0.0,
+        'per_event_p50_us': percentile(samples, 50) / 1000.0,
+        'per_event_p99_us': percentile(samples, 99) / 1000.0,
+        'per_event_max_us': samples[-1] / 1000.0 if samples else 0.0
+    }
+
+def read_wav(path: str) -> tuple:
+    import wave
+    np = lazy_import('numpy')
+    with wave.open(path, 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError("Only 16-bit PCM WAV files are supported.")
+        rate, channels = wav.getframerate(), wav.getnchannels()
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+    return rate, pcm[::channels].copy() if channels > 1 else pcm
+
+def synthetic_speech(rate: int, seconds: float, seed: int = 0) -> tuple:
+    np = lazy_import('numpy')
+    rng = np.random.default_rng(seed)
+    total = int(rate * seconds)
+    signal = rng.normal(0.0, FULL_SCALE * 10 ** (-65 / 20.0), total).astype(np.float32)
+    segments = []
+    position = int(rate * rng.uniform(2.0, 4.0))
+    while position < total:
+        length = min(total - position, int(rate * rng.uniform(0.8, 3.0)))
+        t = np.arange(length, dtype=np.float32) / rate
+        f0 = rng.uniform(110.0, 220.0)
+        voiced = sum(np.sin(2 * np.pi * f0 * harmonic * t) / harmonic for harmonic in (1, 2, 3))
+        envelope = 0.6 + 0.4 * np.sin(2 * np.pi * rng.uniform(3.0, 5.0) * t)
+        signal[position:position + length] += voiced * envelope * FULL_SCALE * 10 ** (-22 / 20.0)
+        segments.append((position / rate, (position + length) / rate))
+        position += length + int(rate * rng.uniform(3.0, 6.0))
+    return np.clip(signal, -32768, 32767).astype(np.int16), segments
+
+def benchmark_vad(args) -> dict:
+    if args.wav:
+        rate, pcm = read_wav(args.wav)
+        segments = None
+    else:
+        rate = 44100
+        pcm, segments = synthetic_speech(rate, args.seconds)
+    clock = [0.0]
+    events = []
+    detector = VoiceActivityDetector(on_change=lambda speaking: events.append((clock[0], speaking)),
+                                     hang_over=args.vad_silence)
+    fmt = CaptureFormat(rate, 1, 1024)
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for offset in range(0, pcm.shape[0], fmt.chunk):
+        clock[0] = offset / rate
+        detector(pcm[offset:offset + fmt.chunk].tobytes(), None, fmt)
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    audio_seconds = pcm.shape[0] / rate
+    result = {
+        'source': args.wav or 'synthetic',
+        'rate': rate,
+        'audio_seconds': audio_seconds,
+        'wall_seconds': wall,
+        'realtime_factor': audio_seconds / wall if wall else 0.0,
+        'cpu_percent_of_realtime': cpu / audio_seconds * 100.0 if audio_seconds else 0.0,
+        'cpu_budget_percent': detector.cpu_budget * 100.0,
+        'stride': detector.stride,
+        'speech_onsets': sum(1 for _, speaking in events if speaking),
+        'silence_mutes': sum(1 for _, speaking in events if not speaking)
+    }
+    if segments is not None:
+        delays = []
+        for begin, end in segments:
+            onset = next((at for at, speaking in events if speaking and begin - 0.1 <= at <= end), None)
+            if onset is not None:
+                delays.append(max(0.0, onset - begin) * 1000.0)
+        result['speech_segments'] = len(segments)
+        result['detected_segments'] = len(delays)
+        result['mean_onset_delay_ms'] = sum(delays) / len(delays) if delays else 0.0
+    return result
+
+def benchmark_watcher(args) -> dict:
+    source = SyntheticProcessSource.generate(args.processes)
+    apps = ['zoom.exe', 'teams.exe', 'obs64.exe']
+    events = []
+    watcher = ProcessWatcher(events.append, source=source)
+    watcher.set_apps(apps)
+    start = time.perf_counter()
+    watcher.poll()
+    first_tick = time.perf_counter() - start
+    churn = max(1, args.processes // 100)
+    samples = []
+    for i in range(args.iterations):
+        for pid in list(source.processes)[:churn]:
+            source.kill(pid)
+        for _ in range(churn):
+            source.spawn(apps[0] if i % 50 == 0 else f"worker{i}.exe")
+        start = time.perf_counter()
+        watcher.poll()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    start = time.perf_counter()
+    for _ in range(10):
+        running_apps = [source.name(pid).lower() for pid in source.pids()]
+        any(app.lower() in running_apps for app in apps)
+    legacy_scan = (time.perf_counter() - start) / 10
+    samples.sort()
+    return {
+        'processes': args.processes,
+        'iterations': len(samples),
+        'first_tick_ms': first_tick * 1000.0,
+        'tick_p50_ms': percentile(samples, 50),
+        'tick_p95_ms': percentile(samples, 95),
+        'legacy_scan_ms': legacy_scan * 1000.0,
+        'edges': len(events)
+    }
+
+def benchmark_log_index(args) -> dict:
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, LOG_FILE)
+        with open(path, 'w', encoding='utf-8') as f:
+            for i in range(args.log_lines):
+                level = 'ERROR' if i % 1000 == 0 else 'INFO'
+                f.write(f"2024-01-01 00:00:00,000:{level}:Volume set to {i % 101}%.\n")
+        log_index = LogIndex(path)
+        start = time.perf_counter()
+        log_index.refresh()
+        index_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for number in range(0, len(log_index), max(1, len(log_index) // 1000)):
+            log_index.line(number)
+        line_time = time.perf_counter() - start
+        start = time.perf_counter()
+        errors = log_index.find_lines(re.compile(b':ERROR:'))
+        filter_time = time.perf_counter() - start
+        result = {
+            'lines': len(log_index),
+            'file_mb': log_index.size / 1e6,
+            'index_ms': index_time * 1000.0,
+            'read_1000_lines_ms': line_time * 1000.0,
+            'filter_errors_ms': filter_time * 1000.0,
+            'error_lines': len(errors)
+        }
+        log_index.close()
+    return result
+
+BENCHMARKS = {
+    'backend': benchmark_backend,
+    'endpoint': benchmark_endpoint,
+    'devices': benchmark_devices,
+    'volume': benchmark_volume,
+    'metering': benchmark_metering,
+    'capture': benchmark_capture,
+    'analysis': benchmark_analysis,
+    'hotkeys': benchmark_hotkeys,
+    'vad': benchmark_vad,
+    'watcher': benchmark_watcher,
+    'logindex': benchmark_log_index
+}
+
+def run_benchmark(args) -> int:
+    try:
+        result = BENCHMARKS[args.benchmark](args)
+    except Exception as e:
+        print(f"Benchmark '{args.benchmark}' failed: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(result, indent=4))
+    return 0
+
+class AssetCache:
+    def __init__(self, base_path: str = None):
+        self.base_path = base_path
+        self.reads = 0
+        self._paths = {}
+        self._pixmaps = {}
+        self._icons = {}
+        self._sounds = {}
+        self._lock = Lock()
+    def path(self, relative_path: str) -> str:
+        path = self._paths.get(relative_path)
+        if path is None:
+            if self.base_path is None:
+                self.base_path = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+            path = self._paths[relative_path] = os.path.join(self.base_path, relative_path)
+        return path
+    def pixmap(self, relative_path: str, tint: str = None) -> QPixmap:
+        key = (relative_path, tint)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            self.reads += tint is None
+            pixmap = QPixmap(self.path(relative_path)) if tint is None else self.tint(self.pixmap(relative_path), tint)
+            self._pixmaps[key] = pixmap
+        return pixmap
+    @staticmethod
+    def tint(pixmap: QPixmap, color: str) -> QPixmap:
+        tinted = QPixmap(pixmap.size())
+        tinted.fill(Qt.transparent)
+        painter = QPainter(tinted)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceAtop)
+        painter.fillRect(tinted.rect(), QColor(color))
+        painter.end()
+        return tinted
+    def icon(self, relative_path: str, tint: str = None) -> QIcon:
+        key = (relative_path, tint)
+        icon = self._icons.get(key)
+        if icon is None:
+            if tint is None and not relative_path.endswith('.png'):
+                self.reads += 1
+                icon = QIcon(self.path(relative_path))
+            else:
+                icon = QIcon(self.pixmap(relative_path, tint))
+            self._icons[key] = icon
+        return icon
+    def sound(self, relative_path: str) -> bytes:
+        with self._lock:
+            data = self._sounds.get(relative_path)
+            if data is None:
+                self.reads += 1
+                with open(self.path(relative_path), 'rb') as f:
+                    data = self._sounds[relative_path] = f.read()
+            return data
+    def preload(self, icons=(), sounds=()):
+        for relative_path in icons:
+            self.icon(relative_path)
+        for relative_path in sounds:
+            try:
+                self.sound(relative_path)
+            except OSError as e:
+                logging.warning(f"Could not preload sound '{relative_path}': {e}")
+
+ASSETS = AssetCache()
+
+class SoundPlayer(Thread):
+    def __init__(self, assets: AssetCache = ASSETS):
+        super().__init__()
+        self.daemon = True
+        self.assets = assets
+        self.running = True
+        self.played = 0
+        self._pending = None
+        self._condition = Condition()
+    def play(self, relative_path: str, muted: bool):
+        with self._condition:
+            self._pending = (relative_path, muted)
+            self._condition.notify()
+    def run(self):
+        while True:
+            with self._condition:
+                while self.running and self._pending is None:
+                    self._condition.wait()
+                if not self.running:
+                    return
+                (relative_path, muted), self._pending = self._pending, None
+            winsound = lazy_import('winsound')
+            try:
+                winsound.PlaySound(self.assets.sound(relative_path), winsound.SND_MEMORY)
+                self.played += 1
+            except Exception as e:
+                logging.error(f"Error playing sound: {e}")
+                winsound.MessageBeep(winsound.MB_ICONEXCLAMATION if muted else winsound.MB_OK)
+    def stop(self):
+        with self._condition:
+            self.running = False
+            self._condition.notify()
+
+class NotificationSink:
+    name = 'abstract'
+    def show(self, title: str, message: str, duration: float, on_click=None):
+        raise NotImplementedError
+
+class ToastSink(NotificationSink):
+    name = 'toast'
+    def __init__(self, icon_path: str = None):
+        self.icon_path = icon_path
+        self._notifier = None
+    def show(self, title: str, message: str, duration: float, on_click=None):
+        if self._notifier is None:
+            self._notifier = lazy_import('win10toast_click').ToastNotifier()
+        self._notifier.show_toast(title, message, icon_path=self.icon_path, duration=duration,
+                                  threaded=False, callback_on_click=on_click)
+
+class PlyerSink(NotificationSink):
+    name = 'plyer'
+    def show(self, title: str, message: str, duration: float, on_click=None):
+        lazy_import('plyer').notification.notify(title=title, message=message, timeout=duration)
+
+class NullSink(NotificationSink):
+    name = 'null'
+    def __init__(self):
+        self.shown = []
+    def show(self, title: str, message: str, duration: float, on_click=None):
+        self.shown.append((title, message))
+
+def create_notification_sinks(name: str = None, icon_path: str = None) -> list:
+    name = name or os.environ.get('MICMASTER_NOTIFIER') or ('toast' if sys.platform == 'win32' else 'plyer')
+    if name == 'toast':
+        return [ToastSink(icon_path), PlyerSink()]
+    if name == 'plyer':
+        return [PlyerSink()]
+    if name == 'null':
+        return [NullSink()]
+    raise ValueError(f"Unknown notification sink: {name}")
+
+class NotificationDispatcher(Thread):
+    def __init__(self, sinks: list, min_interval: float = 1.0, max_pending: int = 8):
+        super().__init__()
+        self.daemon = True
+        self.sinks = sinks
+        self.min_interval = min_interval
+        self.max_pending = max(1, max_pending)
+        self.running = True
+        self.submitted = 0
+        self.shown = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._pending = {}
+        self._serial = 0
+        self._last_shown = 0.0
+        self._condition = Condition()
+    def notify(self, title: str, message: str, key: str = None, duration: float = 5, on_click=None):
+        with self._condition:
+            self.submitted += 1
+            if key is None:
+                self._serial += 1
+                key = f"#{self._serial}"
+            if key in self._pending:
+                self.coalesced += 1
+                del self._pending[key]
+            elif len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                del self._pending[next(iter(self._pending))]
+            self._pending[key] = (title, message, duration, on_click)
+            self._condition.notify()
+    def run(self):
+        while True:
+            with self._condition:
+                while self.running and (not self._pending or time.monotonic() < self._last_shown + self.min_interval):
+                    self._condition.wait(None if not self._pending else self._last_shown + self.min_interval - time.monotonic())
+                if not self.running:
+                    return
+                key = next(iter(self._pending))
+                title, message, duration, on_click = self._pending.pop(key)
+            for sink in self.sinks:
+                try:
+                    sink.show(title, message, duration, on_click)
+                    self.shown += 1
+                    break
+                except Exception as e:
+                    logging.error(f"Error showing notification via {sink.name}: {e}")
+            self._last_shown = time.monotonic()
+    def stop(self):
+        with self._condition:
+            self.running = False
+            self._pending.clear()
+            self._condition.notify()
+
 class ApplicationSelectionDialog(QDialog):
-    def __init__(self, parent=None):
+    names_batch_signal = pyqtSignal(list)
+    scan_finished_signal = pyqtSignal()
+    def __init__(self, parent=None, process_index: ProcessIndex = None):
         super().__init__(parent)
         self.setWindowTitle("Select Applications to Auto-Mute")
         self.setMinimumSize(300, 400)
+        self.process_index = process_index if process_index is not None else ProcessIndex()
+        self.items = {}
         layout = QVBoxLayout()
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Type to filter...")
+        self.filter_edit.textChanged.connect(self.apply_filter)
+        layout.addWidget(self.filter_edit)
         self.process_list = QListWidget()
         self.process_list.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.process_list.setSortingEnabled(True)
         layout.addWidget(self.process_list)
-        running_apps = sorted({proc.name() for proc in psutil.process_iter()})
-        for app in running_apps:
-            self.process_list.addItem(QListWidgetItem(app))
+        self.status_label = QLabel("Scanning running applications...")
+        layout.addWidget(self.status_label)
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
         self.setLayout(layout)
+        self.names_batch_signal.connect(self.add_names)
+        self.scan_finished_signal.connect(self.on_scan_finished)
+        self.add_names(self.process_index.names())
+        self.scan_thread = Thread(target=self.scan_processes, daemon=True)
+        self.scan_thread.start()
+    def scan_processes(self):
+        try:
+            self.process_index.update(PsutilProcessSource(), on_batch=self.names_batch_signal.emit)
+            self.scan_finished_signal.emit()
+        except RuntimeError:
+            pass
+        except Exception as e:
+            automute_log.error(f"Error scanning processes: {e}")
+    def add_names(self, names: list):
+        text = self.filter_edit.text().lower()
+        for name in names:
+            key = name.lower()
+            if key in self.items:
+                continue
+            item = QListWidgetItem(name)
+            self.items[key] = item
+            self.process_list.addItem(item)
+            item.setHidden(text not in key)
+    def apply_filter(self, text: str):
+        text = text.lower()
+        for key, item in self.items.items():
+            item.setHidden(text not in key)
+    def on_scan_finished(self):
+        self.status_label.setText(f"{len(self.items)} applications found.")
     def get_selected_apps(self) -> list:
-        return [self.process_list.item(i).text() for i in range(self.process_list.count())
-                if self.process_list.item(i).isSelected()]
+        return [item.text() for item in self.process_list.selectedItems()]
 
 class ProfileManagementDialog(QDialog):
     def __init__(self, parent=None):
@@ -154,7 +2318,7 @@ class ProfileManagementDialog(QDialog):
                 return
             self.parent_widget.profiles.append(profile_name)
             self.parent_widget.settings['profiles'][profile_name] = self.parent_widget.default_profile_settings()
-            self.parent_widget.save_settings()
+            self.parent_widget.save_settings('profiles')
             self.profile_list.addItem(QListWidgetItem(profile_name))
             logging.info(f"Profile '{profile_name}' created.")
     def rename_profile(self):
@@ -170,7 +2334,7 @@ class ProfileManagementDialog(QDialog):
             idx = self.parent_widget.profiles.index(old_name)
             self.parent_widget.profiles[idx] = new_name
             self.parent_widget.settings['profiles'][new_name] = self.parent_widget.settings['profiles'].pop(old_name)
-            self.parent_widget.save_settings()
+            self.parent_widget.save_settings('profiles')
             selected[0].setText(new_name)
             logging.info(f"Profile '{old_name}' renamed to '{new_name}'.")
     def delete_profile(self):
@@ -185,33 +2349,285 @@ class ProfileManagementDialog(QDialog):
                                      f"Delete profile '{profile_name}'?",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
+            current_name = self.parent_widget.profiles[self.parent_widget.current_profile_index]
             idx = self.parent_widget.profiles.index(profile_name)
             self.parent_widget.profiles.pop(idx)
             self.parent_widget.settings['profiles'].pop(profile_name)
-            self.parent_widget.save_settings()
+            if current_name in self.parent_widget.profiles:
+                self.parent_widget.select_profile(self.parent_widget.profiles.index(current_name))
+            else:
+                self.parent_widget.select_profile(0)
+                self.parent_widget.load_current_profile()
+            self.parent_widget.save_settings('profiles', 'current_profile')
             self.profile_list.takeItem(self.profile_list.row(selected[0]))
             logging.info(f"Profile '{profile_name}' deleted.")
 
+class LogIndex:
+    def __init__(self, path: str):
+        self.path = path
+        self.np = lazy_import('numpy')
+        self.offsets = self.np.zeros(0, dtype=self.np.int64)
+        self.size = 0
+        self._map = None
+        self._lines = {}
+        self._identity = None
+    def __len__(self) -> int:
+        return len(self.offsets)
+    @contextmanager
+    def mapped(self, size: int):
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        try:
+            yield self._map
+        finally:
+            self.close()
+    def refresh(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            self.reset()
+            return False
+        size = stat.st_size
+        identity = (stat.st_dev, stat.st_ino)
+        truncated = size < self.size or (self._identity is not None and identity != self._identity)
+        if truncated:
+            self.reset()
+        self._identity = identity
+        if size == self.size or size == 0:
+            return truncated
+        np = self.np
+        starts = [self.offsets]
+        pos = self.size
+        with self.mapped(size) as data:
+            for chunk_start in range(self.size, size, LOG_INDEX_CHUNK):
+                chunk_end = min(size, chunk_start + LOG_INDEX_CHUNK)
+                chunk = np.frombuffer(data, dtype=np.uint8, count=chunk_end - chunk_start, offset=chunk_start)
+                newlines = np.flatnonzero(chunk == 10) + chunk_start
+                del chunk
+                if len(newlines):
+                    starts.append(np.concatenate(([pos], newlines[:-1] + 1)))
+                    pos = int(newlines[-1]) + 1
+        self.offsets = np.concatenate(starts)
+        self.size = pos
+        return truncated
+    def reset(self):
+        self.close()
+        self.offsets = self.np.zeros(0, dtype=self.np.int64)
+        self.size = 0
+        self._lines = {}
+    def line(self, number: int) -> str:
+        text = self._lines.get(number)
+        if text is not None:
+            return text
+        start = int(self.offsets[number])
+        end = int(self.offsets[number + 1]) if number + 1 < len(self.offsets) else self.size
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(start)
+                text = f.read(end - start).decode('utf-8', 'replace').rstrip('\r\n')
+        except OSError:
+            return ''
+        if len(self._lines) >= LOG_LINE_CACHE:
+            self._lines.clear()
+        self._lines[number] = text
+        return text
+    def find_lines(self, pattern, first_line: int = 0) -> list:
+        if not self.size or first_line >= len(self.offsets):
+            return []
+        offsets = self.offsets
+        count = len(offsets)
+        lines = []
+        pos = int(offsets[first_line])
+        try:
+            with self.mapped(self.size) as data:
+                while True:
+                    match = pattern.search(data, pos, self.size)
+                    if not match:
+                        break
+                    number = int(offsets.searchsorted(match.start(), 'right')) - 1
+                    lines.append(number)
+                    if number + 1 >= count:
+                        break
+                    pos = int(offsets[number + 1])
+        except (OSError, ValueError):
+            return []
+        return lines
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+class LogLineModel(QAbstractListModel):
+    def __init__(self, log_index: LogIndex, parent=None):
+        super().__init__(parent)
+        self.log_index = log_index
+        self.rows = None
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.log_index) if self.rows is None else len(self.rows)
+    def data(self, model_index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not model_index.isValid():
+            return None
+        row = model_index.row()
+        return self.log_index.line(row if self.rows is None else self.rows[row])
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+    def append_rows(self, rows: list):
+        if not rows:
+            return
+        start = self.rowCount()
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+    def append_lines(self, count: int):
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.log_index) - count, len(self.log_index) - 1)
+        self.endInsertRows()
+
 class LogViewerDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, path: str = LOG_FILE):
         super().__init__(parent)
         self.setWindowTitle("View Logs")
         self.resize(600, 400)
+        self.log_index = LogIndex(path)
+        self.model = LogLineModel(self.log_index, self)
+        self.filters = []
         layout = QVBoxLayout()
-        self.log_text = QTextEdit(self)
-        self.log_text.setReadOnly(True)
-        layout.addWidget(self.log_text)
+        filter_layout = QHBoxLayout()
+        self.level_combo = QComboBox()
+        self.level_combo.addItems(["All Levels"] + list(LOG_LEVELS))
+        self.level_combo.currentIndexChanged.connect(self.apply_filters)
+        filter_layout.addWidget(self.level_combo)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search logs...")
+        filter_layout.addWidget(self.search_edit)
+        self.follow_checkbox = QCheckBox("Follow")
+        self.follow_checkbox.setChecked(True)
+        filter_layout.addWidget(self.follow_checkbox)
+        layout.addLayout(filter_layout)
+        self.log_view = QTableView(self)
+        self.log_view.setModel(self.model)
+        self.log_view.setShowGrid(False)
+        self.log_view.setWordWrap(False)
+        self.log_view.horizontalHeader().hide()
+        self.log_view.horizontalHeader().setStretchLastSection(True)
+        self.log_view.verticalHeader().hide()
+        self.log_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.log_view.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 4)
+        layout.addWidget(self.log_view)
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
         btn_box = QDialogButtonBox(QDialogButtonBox.Close)
         btn_box.rejected.connect(self.reject)
         layout.addWidget(btn_box)
         self.setLayout(layout)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        self.tail_timer = QTimer(self)
+        self.tail_timer.setInterval(1000)
+        self.tail_timer.timeout.connect(self.follow_logs)
         self.load_logs()
+        self.tail_timer.start()
     def load_logs(self):
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, "r", encoding="utf-8") as f:
-                self.log_text.setPlainText(f.read())
+        self.log_index.refresh()
+        self.apply_filters()
+        if not os.path.exists(self.log_index.path):
+            self.status_label.setText("Log file not found.")
+        self.log_view.scrollToBottom()
+    def apply_filters(self):
+        self.filters = []
+        if self.level_combo.currentIndex() > 0:
+            level = self.level_combo.currentText().encode()
+            self.filters.append(re.compile(b':' + level + b':'))
+        text = self.search_edit.text()
+        if text:
+            self.filters.append(re.compile(re.escape(text.encode('utf-8')), re.IGNORECASE))
+        self.model.set_rows(self.filter_lines(0) if self.filters else None)
+        self.update_status()
+    def filter_lines(self, first_line: int) -> list:
+        rows = None
+        for pattern in self.filters:
+            lines = self.log_index.find_lines(pattern, first_line)
+            rows = lines if rows is None else sorted(set(rows).intersection(lines))
+        return rows or []
+    def follow_logs(self):
+        previous = len(self.log_index)
+        if self.log_index.refresh():
+            self.apply_filters()
+            return
+        added = len(self.log_index) - previous
+        if added <= 0:
+            return
+        if self.filters:
+            self.model.append_rows(self.filter_lines(previous))
         else:
-            self.log_text.setPlainText("Log file not found.")
+            self.model.append_lines(added)
+        self.update_status()
+        if self.follow_checkbox.isChecked():
+            self.log_view.scrollToBottom()
+    def update_status(self):
+        total = len(self.log_index)
+        shown = self.model.rowCount()
+        self.status_label.setText(f"{shown} of {total} lines" if self.filters else f"{total} lines")
+    def done(self, result: int):
+        self.tail_timer.stop()
+        self.model.set_rows([])
+        self.log_index.close()
+        super().done(result)
+
+class DiagnosticsDialog(QDialog):
+    COLUMNS = ("Stage", "Count", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Max (ms)")
+    def __init__(self, tracker: LatencyTracker, parent=None):
+        super().__init__(parent)
+        self.tracker = tracker
+        self.setWindowTitle("Diagnostics")
+        self.resize(640, 320)
+        layout = QVBoxLayout()
+        self.latency_table = QTableWidget(0, len(self.COLUMNS), self)
+        self.latency_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.latency_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.latency_table.verticalHeader().hide()
+        self.latency_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.latency_table)
+        btn_layout = QHBoxLayout()
+        self.export_btn = QPushButton("Export JSON")
+        self.export_btn.clicked.connect(self.export_json)
+        btn_layout.addWidget(self.export_btn)
+        self.close_btn = QPushButton("Close")
+        self.close_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(self.close_btn)
+        layout.addLayout(btn_layout)
+        self.setLayout(layout)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(1000)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start()
+        self.refresh()
+    def refresh(self):
+        summary = self.tracker.summary()
+        self.latency_table.setRowCount(len(summary))
+        for row, (name, stats) in enumerate(summary.items()):
+            values = (name, str(stats['count']), f"{stats['p50_ms']:.2f}", f"{stats['p95_ms']:.2f}",
+                      f"{stats['p99_ms']:.2f}", f"{stats['max_ms']:.2f}")
+            for column, value in enumerate(values):
+                self.latency_table.setItem(row, column, QTableWidgetItem(value))
+    def export_json(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Latency Histograms", "micmaster_latency.json", "JSON Files (*.json)")
+        if not path:
+            return
+        try:
+            self.tracker.export(path)
+            logging.info(f"Latency histograms exported to {path}.")
+        except Exception as e:
+            logging.error(f"Error exporting latency histograms: {e}")
+            QMessageBox.critical(self, "Error", "Failed to export latency histograms.")
 
 class SettingsWindow(QDialog):
     def __init__(self, parent=None):
@@ -246,6 +2662,27 @@ class SettingsWindow(QDialog):
         self.volume_value_label = QLabel("100%")
         vol_layout.addWidget(self.volume_value_label)
         layout.addLayout(vol_layout)
+        fade_layout = QHBoxLayout()
+        fade_layout.addWidget(QLabel("Mute Fade (ms):"))
+        self.fade_spinbox = QSpinBox()
+        self.fade_spinbox.setRange(0, 2000)
+        self.fade_spinbox.setSingleStep(50)
+        fade_layout.addWidget(self.fade_spinbox)
+        layout.addLayout(fade_layout)
+        hotkey_mode_layout = QHBoxLayout()
+        hotkey_mode_layout.addWidget(QLabel("Hotkey Mode:"))
+        self.hotkey_mode_combo = QComboBox()
+        self.hotkey_mode_combo.addItem("Toggle", 'toggle')
+        self.hotkey_mode_combo.addItem("Hold to Talk", 'hold')
+        hotkey_mode_layout.addWidget(self.hotkey_mode_combo)
+        layout.addLayout(hotkey_mode_layout)
+        vad_layout = QHBoxLayout()
+        self.vad_checkbox = QCheckBox("Auto-mute after silence (s):")
+        vad_layout.addWidget(self.vad_checkbox)
+        self.vad_spinbox = QSpinBox()
+        self.vad_spinbox.setRange(1, 3600)
+        vad_layout.addWidget(self.vad_spinbox)
+        layout.addLayout(vad_layout)
         self.startup_checkbox = QCheckBox("Start on system boot")
         layout.addWidget(self.startup_checkbox)
         self.notifications_checkbox = QCheckBox("Enable desktop notifications")
@@ -285,6 +2722,9 @@ class SettingsWindow(QDialog):
         self.view_logs_btn = QPushButton("View Logs")
         self.view_logs_btn.clicked.connect(self.open_log_viewer)
         btns_layout.addWidget(self.view_logs_btn)
+        self.diagnostics_btn = QPushButton("Diagnostics")
+        self.diagnostics_btn.clicked.connect(self.open_diagnostics)
+        btns_layout.addWidget(self.diagnostics_btn)
         layout.addLayout(btns_layout)
         self.setLayout(layout)
         self.load_settings()
@@ -298,23 +2738,19 @@ class SettingsWindow(QDialog):
     def switch_profile(self, index: int):
         if index != self.parent_widget.current_profile_index:
             logging.info(f"Switching profile from {self.parent_widget.current_profile_index} to {index}.")
-            if index < len(self.parent_widget.profiles):
-                self.parent_widget.current_profile_index = index
-                self.parent_widget.settings['current_profile'] = index
-                self.parent_widget.load_current_profile()
+            if self.parent_widget.switch_profile(index):
                 QMessageBox.information(self, "Profile Switched", f"Switched to profile '{self.parent_widget.profiles[index]}'.")
                 logging.info(f"Switched to profile '{self.parent_widget.profiles[index]}'.")
                 self.load_settings()
             else:
                 logging.error(f"Invalid profile index: {index}. Reverting.")
                 QMessageBox.warning(self, "Profile Switch Failed", "Invalid profile. Reverting.")
-                self.parent_widget.current_profile_index = 0
-                self.parent_widget.settings['current_profile'] = 0
+                self.parent_widget.select_profile(0)
                 self.parent_widget.load_current_profile()
                 self.profile_combo.setCurrentIndex(0)
                 self.load_settings()
     def select_applications(self):
-        dialog = ApplicationSelectionDialog(self)
+        dialog = ApplicationSelectionDialog(self, self.parent_widget.process_index)
         if dialog.exec_():
             selected_apps = dialog.get_selected_apps()
             for app in selected_apps:
@@ -331,167 +2767,974 @@ class SettingsWindow(QDialog):
         self.auto_mute_label.setEnabled(enabled)
     def load_settings(self):
         profile = self.parent_widget.get_current_profile()
-        self.volume_slider.setValue(profile.get('volume', 100))
-        self.volume_value_label.setText(f"{profile.get('volume', 100)}%")
-        self.startup_checkbox.setChecked(profile.get('startup', False))
-        self.notifications_checkbox.setChecked(profile.get('notifications', False))
-        self.sound_notification_checkbox.setChecked(profile.get('sound_notifications', False))
-        self.theme_combo.setCurrentText(profile.get('theme', 'Dark'))
-        self.enable_auto_mute_checkbox.setChecked(profile.get('enable_auto_mute', False))
+        self.volume_slider.setValue(profile.volume)
+        self.volume_value_label.setText(f"{profile.volume}%")
+        self.fade_spinbox.setValue(profile.mute_fade_ms)
+        self.hotkey_mode_combo.setCurrentIndex(max(0, self.hotkey_mode_combo.findData(profile.hotkey_mode)))
+        self.vad_checkbox.setChecked(profile.vad_enabled)
+        self.vad_spinbox.setValue(profile.vad_silence_seconds)
+        self.startup_checkbox.setChecked(profile.startup)
+        self.notifications_checkbox.setChecked(profile.notifications)
+        self.sound_notification_checkbox.setChecked(profile.sound_notifications)
+        self.theme_combo.setCurrentText(profile.theme)
+        self.enable_auto_mute_checkbox.setChecked(profile.enable_auto_mute)
         self.app_list.clear()
-        self.app_list.addItems(profile.get('auto_mute_apps', []))
-        self.tray_checkbox.setChecked(profile.get('tray_enabled', False))
-        self.desktop_shortcut_checkbox.setChecked(profile.get('create_desktop_shortcut', False))
+        self.app_list.addItems(profile.auto_mute_apps)
+        self.tray_checkbox.setChecked(profile.tray_enabled)
+        self.desktop_shortcut_checkbox.setChecked(profile.create_desktop_shortcut)
         self.toggle_auto_mute(self.enable_auto_mute_checkbox.isChecked())
     def update_volume_label(self, value):
         self.volume_value_label.setText(f"{value}%")
     def save_settings(self):
         profile = self.parent_widget.get_current_profile()
-        profile['volume'] = self.volume_slider.value()
-        profile['startup'] = self.startup_checkbox.isChecked()
-        profile['notifications'] = self.notifications_checkbox.isChecked()
-        profile['sound_notifications'] = self.sound_notification_checkbox.isChecked()
-        profile['theme'] = self.theme_combo.currentText()
-        profile['enable_auto_mute'] = self.enable_auto_mute_checkbox.isChecked()
-        profile['auto_mute_apps'] = [self.app_list.item(i).text() for i in range(self.app_list.count())]
-        profile['tray_enabled'] = self.tray_checkbox.isChecked()
-        profile['create_desktop_shortcut'] = self.desktop_shortcut_checkbox.isChecked()
+        profile.volume = self.volume_slider.value()
+        profile.mute_fade_ms = self.fade_spinbox.value()
+        profile.hotkey_mode = self.hotkey_mode_combo.currentData()
+        profile.vad_enabled = self.vad_checkbox.isChecked()
+        profile.vad_silence_seconds = self.vad_spinbox.value()
+        profile.startup = self.startup_checkbox.isChecked()
+        profile.notifications = self.notifications_checkbox.isChecked()
+        profile.sound_notifications = self.sound_notification_checkbox.isChecked()
+        profile.theme = self.theme_combo.currentText()
+        profile.enable_auto_mute = self.enable_auto_mute_checkbox.isChecked()
+        profile.auto_mute_apps = [self.app_list.item(i).text() for i in range(self.app_list.count())]
+        profile.tray_enabled = self.tray_checkbox.isChecked()
+        profile.create_desktop_shortcut = self.desktop_shortcut_checkbox.isChecked()
         self.parent_widget.settings['current_profile'] = self.parent_widget.current_profile_index
-        self.parent_widget.save_settings()
-        if profile['create_desktop_shortcut']:
+        self.parent_widget.save_settings('profiles', 'current_profile')
+        if profile.create_desktop_shortcut:
             self.parent_widget.create_desktop_shortcut_method()
         else:
             self.parent_widget.remove_desktop_shortcut_method()
-        if profile['startup']:
+        if profile.startup:
             self.parent_widget.add_to_startup()
         else:
             self.parent_widget.remove_from_startup()
-        setup_logging(profile.get('enable_logging', True))
+        self.parent_widget.configure_logging()
         QMessageBox.information(self, "Settings Saved", "Settings saved successfully.")
         self.accept()
     def reset_settings(self):
-        profile = self.parent_widget.get_current_profile()
-        default = self.parent_widget.default_profile_settings()
-        for key in default:
-            profile[key] = default[key]
+        self.parent_widget.get_current_profile().reset()
         self.load_settings()
     def open_log_viewer(self):
         dialog = LogViewerDialog(self)
         dialog.exec_()
+    def open_diagnostics(self):
+        dialog = DiagnosticsDialog(self.parent_widget.latency, self)
+        dialog.exec_()
     def resource_path(self, relative_path: str) -> str:
-        try:
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
-        return os.path.join(base_path, relative_path)
+        return ASSETS.path(relative_path)
 
-class HotkeyListener(Thread):
-    def __init__(self, callback, hotkey: str):
-        super().__init__()
-        self.callback = callback
-        self.hotkey = hotkey
-        self.daemon = True
-    def run(self):
-        try:
-            keyboard.add_hotkey(self.hotkey, self.callback)
-            logging.info(f"Hotkey '{self.hotkey}' listener started.")
-            keyboard.wait()
-        except Exception as e:
-            logging.error(f"Error in HotkeyListener: {e}")
+class KeyEvent(NamedTuple):
+    event_type: str
+    name: str
+
+KEY_ALIASES = {
+    'control': 'ctrl', 'left ctrl': 'ctrl', 'right ctrl': 'ctrl',
+    'left shift': 'shift', 'right shift': 'shift',
+    'left alt': 'alt', 'right alt': 'alt', 'alt gr': 'alt',
+    'win': 'windows', 'left windows': 'windows', 'right windows': 'windows',
+    'return': 'enter', 'esc': 'escape', 'del': 'delete', 'ins': 'insert',
+    '+': 'plus', ',': 'comma'
+}
+
+HOTKEY_ACTIONS = {
+    'toggle_mute': ('toggle_mute', None),
+    'push_to_talk': ('unmute', 'mute'),
+    'push_to_mute': ('mute', 'unmute')
+}
+
+def normalize_key(name: str) -> str:
+    name = (name or '').strip().lower()
+    return KEY_ALIASES.get(name, name)
+
+def parse_hotkey(hotkey: str) -> tuple:
+    steps = []
+    for step in hotkey.split(','):
+        keys = [normalize_key(key) for key in step.split('+')]
+        if not all(keys):
+            raise ValueError(f"Invalid hotkey: {hotkey!r}")
+        steps.append(frozenset(keys))
+    return tuple(steps)
+
+class HotkeyEngine:
+    def __init__(self, bindings: dict = None, chord_timeout: float = 1.0):
+        self.chord_timeout = chord_timeout
+        self.events = 0
+        self._names = {}
+        self.compile(bindings or {})
+    def compile(self, bindings: dict):
+        transitions, partials, actions, keys = {}, set(), {}, set()
+        for hotkey, action in bindings.items():
+            if action not in HOTKEY_ACTIONS:
+                raise ValueError(f"Unknown hotkey action: {action!r}")
+            state = 0
+            for chord in parse_hotkey(hotkey):
+                keys |= chord
+                for size in range(1, len(chord)):
+                    partials.update((state, frozenset(subset)) for subset in combinations(chord, size))
+                state = transitions.setdefault((state, chord), len(transitions) + 1)
+            actions[state] = HOTKEY_ACTIONS[action]
+        shadowed = actions.keys() & {state for state, _ in transitions}
+        if shadowed:
+            hotkey_log.warning("Some hotkey sequences start with another bound hotkey and can never complete.")
+        self._tables = (transitions, partials, actions, frozenset(keys))
+        self.reset()
+    def reset(self):
+        self.pressed = set()
+        self.state = 0
+        self.deadline = 0.0
+        self.held = None
+    def feed(self, event_type: str, name: str):
+        self.events += 1
+        key = self._names.get(name)
+        if key is None:
+            key = self._names[name] = normalize_key(name)
+        if event_type == 'up':
+            self.pressed.discard(key)
+            if self.held is not None and key in self.held[0]:
+                release, self.held = self.held[1], None
+                return release
+            return None
+        if key in self.pressed:
+            return None
+        self.pressed.add(key)
+        transitions, partials, actions, keys = self._tables
+        if key not in keys:
+            self.state = 0
+            return None
+        now = time.monotonic()
+        if self.state and now > self.deadline:
+            self.state = 0
+        chord = frozenset(self.pressed)
+        state = transitions.get((self.state, chord))
+        if state is None and self.state:
+            state = transitions.get((0, chord))
+        if state is None:
+            if (self.state, chord) not in partials:
+                self.state = 0
+            return None
+        action = actions.get(state)
+        if action is None:
+            self.state = state
+            self.deadline = now + self.chord_timeout
+            return None
+        self.state = 0
+        if action[1] is not None:
+            self.held = (chord, action[1])
+        return action[0]
+
+class InputSource:
+    def hook(self, callback):
+        raise NotImplementedError
+    def unhook(self, handle):
+        raise NotImplementedError
+
+class KeyboardInputSource(InputSource):
+    def __init__(self):
+        self.keyboard = lazy_import('keyboard')
+    def hook(self, callback):
+        return self.keyboard.hook(callback)
+    def unhook(self, handle):
+        self.keyboard.unhook(handle)
+
+class FakeInputSource(InputSource):
+    def __init__(self):
+        self.hooks = []
+    def hook(self, callback):
+        self.hooks.append(callback)
+        return callback
+    def unhook(self, handle):
+        if handle in self.hooks:
+            self.hooks.remove(handle)
+    def send(self, event):
+        for callback in list(self.hooks):
+            callback(event)
+    def replay(self, events):
+        for event_type, name in events:
+            self.send(KeyEvent(event_type, name))
+    def press(self, hotkey: str):
+        for step in hotkey.split(','):
+            keys = [key.strip() for key in step.split('+')]
+            self.replay([('down', key) for key in keys] + [('up', key) for key in reversed(keys)])
+
+def create_input_source(name: str = None) -> InputSource:
+    name = name or os.environ.get('MICMASTER_INPUT', 'keyboard')
+    if name == 'keyboard':
+        return KeyboardInputSource()
+    if name == 'fake':
+        return FakeInputSource()
+    raise ValueError(f"Unknown input source: {name}")
+
+class HotkeyDispatcher:
+    DEBOUNCED = ('toggle_mute',)
+    def __init__(self, deliver, source: InputSource = None, debounce: float = 0.2, tracker: LatencyTracker = None,
+                 chord_timeout: float = 1.0):
+        self.deliver = deliver
+        self.tracker = tracker
+        self.source = source if source is not None else create_input_source()
+        self.debounce = debounce
+        self.bindings = {}
+        self.engine = HotkeyEngine(chord_timeout=chord_timeout)
+        self._hook = None
+        self._recording = None
+        self._last_fired = {}
+        self._lock = Lock()
+    def bind(self, bindings: dict):
+        with self._lock:
+            self.engine.compile(bindings)
+            self.bindings = dict(bindings)
+            self._update_hook()
+        hotkey_log.info(f"Hotkey bindings: {self.bindings or 'none'}.")
+    def _update_hook(self):
+        if (self.bindings or self._recording is not None) and self._hook is None:
+            self._hook = self.source.hook(self.on_event)
+        elif not self.bindings and self._recording is None and self._hook is not None:
+            self.source.unhook(self._hook)
+            self._hook = None
+    def on_event(self, event):
+        if self._recording is not None:
+            self._record(event)
+            return
+        action = self.engine.feed(event.event_type, event.name)
+        if action is not None:
+            self.fire(action)
+    def fire(self, action: str):
+        trace = self.tracker.start('hotkey') if self.tracker else None
+        if action in self.DEBOUNCED:
+            now = time.monotonic()
+            if now - self._last_fired.get(action, float('-inf')) < self.debounce:
+                return
+            self._last_fired[action] = now
+        self.deliver(action, trace)
+    def start_recording(self, on_change):
+        with self._lock:
+            self._recording = ([], [], set(), on_change)
+            self._update_hook()
+    def _record(self, event):
+        steps, chord, held, on_change = self._recording
+        key = normalize_key(event.name)
+        if not key:
+            return
+        if event.event_type == 'down':
+            if key in held:
+                return
+            held.add(key)
+            if key in chord:
+                return
+            chord.append(key)
+        else:
+            held.discard(key)
+            if held or not chord:
+                return
+            steps.append('+'.join(chord))
+            chord.clear()
+        on_change(', '.join(steps + ['+'.join(chord)] if chord else steps))
+    def stop_recording(self) -> str:
+        with self._lock:
+            if self._recording is None:
+                return ''
+            steps, chord, held, on_change = self._recording
+            self._recording = None
+            self.engine.reset()
+            self._update_hook()
+        return ', '.join(steps + ['+'.join(chord)] if chord else steps)
+    def close(self):
+        with self._lock:
+            self._recording = None
+        self.bind({})
 
 class AudioStreamThread(Thread):
-    def __init__(self, parent=None):
+    def __init__(self, pacer: LevelPacer = None, source: CaptureSource = None, on_error=None, chunk: int = 1024,
+                 rate: int = 0, channels: int = 1, max_latency_ms: float = 100.0, idle_close: float = 10.0,
+                 min_backoff: float = 0.5, max_backoff: float = 30.0, analyzer=None):
         super().__init__()
-        self.parent = parent
+        self.daemon = True
+        self.pacer = pacer
+        self.analyzers = (analyzer,) if analyzer is not None else ()
+        self.source = source or create_capture_source()
+        self.on_error = on_error
         self.running = True
-        self.chunk = 1024
-        self.format = pyaudio.paInt16
-        self.channels = 1
-        self.rate = 44100
-    def run(self):
-        p = pyaudio.PyAudio()
+        self.idle_close = idle_close
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.adapt_interval = 5.0
+        self.stable_period = 30.0
+        self.consumers = set()
+        self.stats = CaptureStats()
+        self.format = None
+        self.opens = 0
+        self.resumes = 0
+        self._requested = (chunk, rate, channels, max_latency_ms)
+        self.engine = MeteringEngine(chunk * channels)
+        self._open = False
+        self._reconfigure = False
+        self._renegotiate = False
+        self._last_adc = 0.0
+        self._last_arrival = 0.0
+        self._last_adapt = 0.0
+        self._last_trouble = 0.0
+        self._error_reported = False
+        self._condition = Condition()
+    def add_consumer(self, name: str):
+        with self._condition:
+            if name not in self.consumers:
+                self.consumers.add(name)
+                self._condition.notify()
+    def remove_consumer(self, name: str):
+        with self._condition:
+            if name in self.consumers:
+                self.consumers.discard(name)
+                self._condition.notify()
+    def add_analyzer(self, analyzer):
+        with self._condition:
+            if analyzer not in self.analyzers:
+                self.analyzers = self.analyzers + (analyzer,)
+    def remove_analyzer(self, analyzer):
+        with self._condition:
+            self.analyzers = tuple(existing for existing in self.analyzers if existing is not analyzer)
+    def configure(self, chunk: int, rate: int, max_latency_ms: float, channels: int = 1):
+        with self._condition:
+            requested = (chunk, rate, channels, max_latency_ms)
+            if requested == self._requested:
+                return
+            self._requested = requested
+            self._renegotiate = True
+            self._reconfigure = True
+            self._condition.notify()
+    @property
+    def max_chunk(self) -> int:
+        chunk, _, _, max_latency_ms = self._requested
+        limit = int(self.format.rate * max_latency_ms / 1000.0) if self.format else chunk
+        return max(chunk, limit)
+    def on_audio(self, in_data, frame_count: int, adc_time: float, overflow: bool) -> bool:
+        stats = self.stats
+        fmt = self.format
+        now = time.monotonic()
+        stats.chunks += 1
+        stats.frames += frame_count
+        expected = frame_count / fmt.rate
+        if overflow:
+            stats.overflows += 1
+            stats.dropped_frames += frame_count
+            self._last_trouble = now
+        elif self._last_adc and adc_time:
+            gap = adc_time - self._last_adc - expected
+            if gap > expected * 0.5:
+                stats.dropped_frames += int(gap * fmt.rate)
+                self._last_trouble = now
+        self._last_adc = adc_time
+        if self._last_arrival:
+            deviation = abs(now - self._last_arrival - expected) * 1000.0
+            stats.jitter_ms += (deviation - stats.jitter_ms) * 0.1
+        self._last_arrival = now
         try:
-            stream = p.open(format=self.format,
-                            channels=self.channels,
-                            rate=self.rate,
-                            input=True,
-                            frames_per_buffer=self.chunk)
+            reading = self.engine.process(in_data)
+            if self.pacer is not None:
+                self.pacer.push(reading.level)
+            for analyzer in self.analyzers:
+                analyzer(in_data, reading, fmt)
         except Exception as e:
-            logging.error(f"Error opening audio stream: {e}")
-            QMessageBox.critical(None, "Error", "Failed to open audio stream.")
+            audio_log.error(f"Error processing audio chunk: {e}")
+        if now - self._last_adapt > self.adapt_interval:
+            self.adapt(now)
+        return self.running
+    def adapt(self, now: float):
+        fmt = self.format
+        budget_ms = fmt.chunk_seconds * 1000.0
+        target = self._requested[0]
+        if (self._last_trouble > self._last_adapt or self.stats.jitter_ms > budget_ms * 0.5) and fmt.chunk * 2 <= self.max_chunk:
+            chunk = fmt.chunk * 2
+        elif fmt.chunk > target and now - self._last_trouble > self.stable_period and self.stats.jitter_ms < budget_ms * 0.1:
+            chunk = max(target, fmt.chunk // 2)
+        else:
+            self._last_adapt = now
             return
-        while self.running:
+        self._last_adapt = now
+        audio_log.info(f"Adapting capture chunk {fmt.chunk} -> {chunk} frames "
+                       f"(jitter {self.stats.jitter_ms:.1f} ms, overflows {self.stats.overflows}).")
+        with self._condition:
+            self.format = replace(fmt, chunk=chunk)
+            self.stats.chunk_changes += 1
+            self._reconfigure = True
+            self._condition.notify()
+    def open_stream(self) -> bool:
+        try:
+            if self.format is None:
+                chunk, rate, channels, _ = self._requested
+                rate, channels = self.source.negotiate(rate, channels)
+                self.format = CaptureFormat(rate, channels, chunk)
+            self.source.open(self.format, self.on_audio)
+        except Exception as e:
+            audio_log.error(f"Error opening audio stream: {e}")
+            self.source.close()
+            if not self._error_reported and self.on_error:
+                self._error_reported = True
+                self.on_error("Failed to open audio stream.")
+            return False
+        self._open = True
+        self._last_adc = self._last_arrival = 0.0
+        self._last_adapt = time.monotonic()
+        self.opens += 1
+        audio_log.debug(f"Audio stream opened at {self.format.rate} Hz, {self.format.channels} channel(s), "
+                        f"{self.format.chunk} frames per chunk.")
+        return True
+    def close_stream(self):
+        if self._open:
+            self._open = False
+            audio_log.debug(f"Audio stream closed ({self.stats}).")
+        self.source.close()
+    def _wait(self, predicate, timeout: float = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self.running or predicate(), timeout)
+    def _backoff(self, backoff: float) -> float:
+        self._wait(lambda: not self.consumers or self._reconfigure, backoff)
+        return min(self.max_backoff, backoff * 2)
+    def run(self):
+        backoff = self.min_backoff
+        try:
+            while self.running:
+                if not self.consumers:
+                    if self._open and not self._wait(lambda: bool(self.consumers), self.idle_close):
+                        self.close_stream()
+                    elif not self._open:
+                        self._wait(lambda: bool(self.consumers))
+                    continue
+                with self._condition:
+                    if self._reconfigure:
+                        self._reconfigure = False
+                        self.close_stream()
+                        if self._renegotiate:
+                            self._renegotiate = False
+                            self.format = None
+                if not self._open and not self.open_stream():
+                    backoff = self._backoff(backoff)
+                    continue
+                self.resumes += 1
+                started = time.monotonic()
+                self.source.start()
+                while self.running and self.consumers and not self._reconfigure and self.source.is_active():
+                    self._wait(lambda: not self.consumers or self._reconfigure, 0.5)
+                self.source.stop()
+                if time.monotonic() - started > 10.0:
+                    backoff = self.min_backoff
+                if self.running and self.consumers and not self._reconfigure:
+                    self.stats.restarts += 1
+                    audio_log.warning(f"Audio stream stopped unexpectedly; restarting in {backoff:.1f} s.")
+                    self.close_stream()
+                    self.format = None
+                    backoff = self._backoff(backoff)
+                elif not self._reconfigure:
+                    audio_log.debug("Audio capture paused.")
+        finally:
+            self.close_stream()
+    def poll(self):
+        pass
+    def stop(self):
+        with self._condition:
+            self.running = False
+            self._condition.notify()
+
+class SpectrumAnalyzer:
+    def __init__(self, bands: int = 16, load: int = 1):
+        self._np = lazy_import('numpy')
+        self.bands = bands
+        self.load = max(1, int(load))
+        self.energies = self._np.zeros(bands, dtype=self._np.float32)
+        self._window = None
+        self._edges = None
+    def __call__(self, in_data, reading: MeterReading, fmt: CaptureFormat = None):
+        np = self._np
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        if self._window is None or self._window.shape[0] != samples.shape[0]:
+            self._window = np.hanning(samples.shape[0]).astype(np.float32)
+            bins = samples.shape[0] // 2 + 1
+            self._edges = np.unique(np.geomspace(1, bins, self.bands + 1).astype(int))
+        for _ in range(self.load):
+            spectrum = np.abs(np.fft.rfft(samples * self._window))
+            for band, (low, high) in enumerate(zip(self._edges, self._edges[1:])):
+                self.energies[band] = float(spectrum[low:high].mean()) / FULL_SCALE
+        return self.energies
+
+class VoiceActivityDetector:
+    def __init__(self, on_change=None, threshold_db: float = -45.0, hysteresis_db: float = 6.0, max_zcr: float = 0.35,
+                 attack: float = 0.03, hang_over: float = 30.0, frame_ms: float = 10.0, cpu_budget: float = 0.02,
+                 on_digital_silence=None):
+        self._np = lazy_import('numpy')
+        self.on_change = on_change
+        self.on_digital_silence = on_digital_silence
+        self.threshold_db = threshold_db
+        self.hysteresis_db = hysteresis_db
+        self.max_zcr = max_zcr
+        self.attack = attack
+        self.hang_over = hang_over
+        self.frame_ms = frame_ms
+        self.cpu_budget = cpu_budget
+        self.speaking = None
+        self.transitions = 0
+        self.stride = 1
+        self.audio_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self._rate = None
+        self._frame = 0
+        self._scratch = self._np.zeros(0, dtype=self._np.float32)
+        self._carried = 0
+        self._active = False
+        self._run = 0
+        self._silence = 0
+        self._window_audio = 0.0
+        self._window_cpu = 0.0
+        self._zero_seconds = 0.0
+        self._watching = False
+    def watch_silence(self):
+        self._zero_seconds = 0.0
+        self._watching = True
+    def reset(self):
+        self.speaking = None
+        self._run = 0
+        self._silence = 0
+        self._watching = False
+    def configure(self, threshold_db: float = None, hang_over: float = None):
+        if threshold_db is not None:
+            self.threshold_db = float(threshold_db)
+        if hang_over is not None:
+            self.hang_over = float(hang_over)
+    def _reset(self, rate: int):
+        self._rate = rate
+        self._frame = max(16, int(rate * self.frame_ms / 1000.0))
+        self._carried = 0
+    def __call__(self, in_data, reading: MeterReading = None, fmt: CaptureFormat = None):
+        start = time.perf_counter()
+        np = self._np
+        rate, channels = (fmt.rate, fmt.channels) if fmt else (self._rate or 44100, 1)
+        if rate != self._rate:
+            self._reset(rate)
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        if channels > 1:
+            samples = samples[::channels]
+        count = samples.shape[0]
+        if self._watching:
+            self._zero_seconds = 0.0 if samples.any() else self._zero_seconds + count / rate
+            if self._zero_seconds >= DIGITAL_SILENCE_SECONDS:
+                self._watching = False
+                if self.on_digital_silence:
+                    self.on_digital_silence()
+        total = self._carried + count
+        if total > self._scratch.shape[0]:
+            scratch = np.zeros(total, dtype=np.float32)
+            scratch[:self._carried] = self._scratch[:self._carried]
+            self._scratch = scratch
+        scratch = self._scratch
+        np.copyto(scratch[self._carried:total], samples)
+        size = self._frame
+        used = total // size * size
+        if used:
+            frames = scratch[:used].reshape(-1, size)[:, ::self.stride]
+            width = frames.shape[1]
+            energy = np.einsum('ij,ij->i', frames, frames) / width
+            db = 10.0 * np.log10(energy / (FULL_SCALE * FULL_SCALE) + 1e-12)
+            signs = np.signbit(frames)
+            zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (width - 1)
+            onset = (db >= self.threshold_db) & (zcr <= min(1.0, self.max_zcr * self.stride))
+            sustain = db >= self.threshold_db - self.hysteresis_db
+            frame_seconds = size / rate
+            for is_onset, is_sustained in zip(onset.tolist(), sustain.tolist()):
+                self._step(is_sustained if self._active else is_onset, frame_seconds)
+            if used < total:
+                scratch[:total - used] = scratch[used:total]
+        self._carried = total - used
+        elapsed = time.perf_counter() - start
+        self.audio_seconds += count / rate
+        self.cpu_seconds += elapsed
+        self._window_audio += count / rate
+        self._window_cpu += elapsed
+        if self._window_audio >= 1.0:
+            if self._window_cpu > self._window_audio * self.cpu_budget and self.stride < 4:
+                self.stride *= 2
+                audio_log.warning(f"Voice detection exceeded its CPU budget; analysing every {self.stride} samples.")
+            self._window_audio = self._window_cpu = 0.0
+        return self.speaking
+    def _step(self, voiced: bool, frame_seconds: float):
+        self._active = voiced
+        if voiced:
+            self._run += 1
+            self._silence = 0
+            if self.speaking is not True and self._run * frame_seconds >= self.attack:
+                self._set(True)
+        else:
+            self._run = 0
+            self._silence += 1
+            if self.speaking is not False and self._silence * frame_seconds >= self.hang_over:
+                self._set(False)
+    def _set(self, speaking: bool):
+        self.speaking = speaking
+        self.transitions += 1
+        if self.on_change:
+            self.on_change(speaking)
+    @property
+    def cpu_load(self) -> float:
+        return self.cpu_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+class SharedAudioRing:
+    HEADER = 4
+    def __init__(self, shm, level_capacity: int, pcm_capacity: int, bands: int, owner: bool):
+        np = self._np = lazy_import('numpy')
+        self.shm = shm
+        self.owner = owner
+        self.bands = bands
+        buf = shm.buf
+        self.header = np.ndarray((self.HEADER,), dtype=np.uint64, buffer=buf)
+        offset = self.HEADER * 8
+        self.levels = np.ndarray((level_capacity, 4 + bands), dtype=np.float32, buffer=buf, offset=offset)
+        offset += self.levels.nbytes
+        self.pcm = np.ndarray((pcm_capacity,), dtype=np.int16, buffer=buf, offset=offset)
+    @staticmethod
+    def size(level_capacity: int, pcm_capacity: int, bands: int) -> int:
+        return SharedAudioRing.HEADER * 8 + level_capacity * (4 + bands) * 4 + pcm_capacity * 2
+    @classmethod
+    def create(cls, level_capacity: int = 256, pcm_capacity: int = 1 << 19, bands: int = 16) -> 'SharedAudioRing':
+        from multiprocessing import shared_memory
+        shm = shared_memory.SharedMemory(create=True, size=cls.size(level_capacity, pcm_capacity, bands))
+        ring = cls(shm, level_capacity, pcm_capacity, bands, owner=True)
+        ring.header[:] = (0, 0, level_capacity, pcm_capacity)
+        return ring
+    @classmethod
+    def attach(cls, name: str, bands: int = 16) -> 'SharedAudioRing':
+        from multiprocessing import shared_memory
+        shm = shared_memory.SharedMemory(name=name)
+        header = lazy_import('numpy').ndarray((cls.HEADER,), dtype='uint64', buffer=shm.buf)
+        level_capacity, pcm_capacity = int(header[2]), int(header[3])
+        del header
+        return cls(shm, level_capacity, pcm_capacity, bands, owner=False)
+    @property
+    def name(self) -> str:
+        return self.shm.name
+    @property
+    def sequence(self) -> int:
+        return int(self.header[0])
+    def write(self, in_data, reading: MeterReading, energies=None):
+        np = self._np
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        capacity = self.pcm.shape[0]
+        count = min(samples.shape[0], capacity)
+        position = int(self.header[1]) % capacity
+        first = min(count, capacity - position)
+        self.pcm[position:position + first] = samples[:first]
+        self.pcm[:count - first] = samples[first:count]
+        self.header[1] += count
+        sequence = int(self.header[0])
+        record = self.levels[sequence % self.levels.shape[0]]
+        record[:4] = (reading.peak, reading.rms, reading.dbfs, reading.level)
+        if energies is not None:
+            record[4:4 + len(energies)] = energies
+        self.header[0] = sequence + 1
+    def latest(self):
+        sequence = self.sequence
+        if sequence == 0:
+            return None
+        record = self.levels[(sequence - 1) % self.levels.shape[0]]
+        return MeterReading(float(record[0]), float(record[1]), float(record[2]), int(record[3]))
+    def latest_pcm(self, frames: int) -> list:
+        capacity = self.pcm.shape[0]
+        frames = min(frames, capacity, int(self.header[1]))
+        end = int(self.header[1]) % capacity
+        if frames <= end:
+            return [self.pcm[end - frames:end]]
+        return [self.pcm[capacity - (frames - end):], self.pcm[:end]]
+    def close(self):
+        self.header = self.levels = self.pcm = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+def analysis_process_main(ring_name: str, connection, source_name: str, config: dict, bands: int, load: int):
+    ring = SharedAudioRing.attach(ring_name, bands)
+    analyzer = SpectrumAnalyzer(bands, load) if load else None
+    send_lock = Lock()
+    def on_chunk(in_data, reading, fmt):
+        ring.write(in_data, reading, analyzer(in_data, reading) if analyzer else None)
+    def report_error(message: str):
+        with send_lock:
             try:
-                data = stream.read(self.chunk, exception_on_overflow=False)
-                audio_data = np.frombuffer(data, dtype=np.int16)
-                peak = np.abs(audio_data).max()
-                level = int((peak / 32768) * 100)
-                self.parent.audio_level_signal.emit(level)
-            except Exception as e:
-                logging.error(f"Error reading audio stream: {e}")
+                connection.send(('error', message))
+            except (OSError, ValueError):
+                pass
+    thread = None
+    try:
+        thread = AudioStreamThread(source=create_capture_source(source_name), analyzer=on_chunk, on_error=report_error, **config)
+        thread.start()
+    except Exception as e:
+        audio_log.error(f"Error opening audio stream: {e}")
+        report_error("Failed to open audio stream.")
+    try:
+        while True:
+            try:
+                command, *payload = connection.recv()
+            except (EOFError, OSError):
                 break
-        stream.stop_stream()
-        stream.close()
-        p.terminate()
+            if command == 'stop':
+                break
+            if thread is None:
+                continue
+            if command == 'active':
+                (thread.add_consumer if payload[0] else thread.remove_consumer)('analysis')
+            elif command == 'configure':
+                thread.configure(*payload)
+    finally:
+        if thread is not None:
+            thread.stop()
+            thread.join(2.0)
+        ring.close()
+
+class AnalysisProcess:
+    def __init__(self, pacer: LevelPacer, source_name: str = None, chunk: int = 1024, rate: int = 0,
+                 max_latency_ms: float = 100.0, load: int = 0, bands: int = 16, on_error=None):
+        self.pacer = pacer
+        self.on_error = on_error
+        self.source_name = source_name or os.environ.get('MICMASTER_CAPTURE') or 'pyaudio'
+        self.config = {'chunk': chunk, 'rate': rate, 'max_latency_ms': max_latency_ms}
+        self.load = load
+        self.bands = bands
+        self.consumers = set()
+        self.ring = None
+        self.process = None
+        self._connection = None
+        self._listener = None
+        self._last_sequence = 0
+        self._lock = Lock()
+    def start(self):
+        context = multiprocessing.get_context('spawn')
+        self.ring = SharedAudioRing.create(bands=self.bands)
+        self._connection, child_connection = context.Pipe()
+        self.process = context.Process(target=analysis_process_main, name='MicMasterAnalysis', daemon=True,
+                                       args=(self.ring.name, child_connection, self.source_name, self.config,
+                                             self.bands, self.load))
+        self.process.start()
+        child_connection.close()
+        self._listener = Thread(target=self._listen, args=(self._connection,), name='MicMasterAnalysisEvents', daemon=True)
+        self._listener.start()
+        audio_log.info(f"Audio analysis process started (pid {self.process.pid}).")
+    def _listen(self, connection):
+        while True:
+            try:
+                event, *payload = connection.recv()
+            except (EOFError, OSError, ValueError):
+                return
+            if event == 'error':
+                audio_log.error(f"Audio analysis process: {payload[0]}")
+                if self.on_error:
+                    self.on_error(payload[0])
+    def _send(self, *message):
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._connection.send(message)
+            except (OSError, ValueError) as e:
+                audio_log.error(f"Error sending to audio analysis process: {e}")
+    def add_consumer(self, name: str):
+        if name not in self.consumers:
+            self.consumers.add(name)
+            if len(self.consumers) == 1:
+                self._send('active', True)
+    def remove_consumer(self, name: str):
+        if name in self.consumers:
+            self.consumers.discard(name)
+            if not self.consumers:
+                self._send('active', False)
+    def configure(self, chunk: int, rate: int, max_latency_ms: float, channels: int = 1):
+        self._send('configure', chunk, rate, max_latency_ms, channels)
+    def poll(self):
+        if self.ring is None or self.pacer is None:
+            return
+        sequence = self.ring.sequence
+        if sequence != self._last_sequence:
+            self._last_sequence = sequence
+            self.pacer.push(self.ring.latest().level)
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
     def stop(self):
-        self.running = False
+        self._send('stop')
+    def join(self, timeout: float = 2.0):
+        if self.process is not None:
+            self.process.join(timeout)
+            if self.process.is_alive():
+                audio_log.warning("Audio analysis process did not exit; terminating it.")
+                self.process.terminate()
+                self.process.join(timeout)
+        if self._listener is not None:
+            self._listener.join(timeout)
+            self._listener = None
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
 
 class MicMaster(QWidget):
-    toggle_mute_signal = pyqtSignal()
-    audio_level_signal = pyqtSignal(int)
+    hotkey_action_signal = pyqtSignal(str, object)
+    auto_mute_signal = pyqtSignal(bool)
+    settings_error_signal = pyqtSignal(str)
+    update_result_signal = pyqtSignal(object)
+    endpoint_result_signal = pyqtSignal(str, object, object, object)
+    notification_clicked_signal = pyqtSignal()
+    audio_error_signal = pyqtSignal(str)
+    endpoint_state_signal = pyqtSignal(bool, float)
+    devices_changed_signal = pyqtSignal()
+    hotkey_recorded_signal = pyqtSignal(str)
+    voice_activity_signal = pyqtSignal(bool)
+    digital_silence_signal = pyqtSignal()
     def __init__(self):
         super().__init__()
         self.is_muted = False
-        self.device = None
-        self.interface = None
-        self.volume = None
-        self.current_hotkey = None
+        self.latency = LatencyTracker()
+        self.backend = create_backend()
+        self.endpoint_worker = AudioEndpointWorker(self.backend, self.endpoint_result_signal.emit)
+        self.volume_controller = VolumeController(lambda level: self.endpoint_worker.submit('volume', level))
+        self.endpoint_error_shown = False
+        self.endpoint_recheck_timer = QTimer(self)
+        self.endpoint_recheck_timer.setSingleShot(True)
+        self.endpoint_recheck_timer.setInterval(300)
+        self.endpoint_recheck_timer.timeout.connect(self.recheck_endpoint_state)
+        self.current_device_id = None
+        self.hotkey = None
+        self.hotkey_dispatcher = None
+        self.recording = False
         self.tray_icon = None
         self.tray_enabled = False
         self.use_sound_notification = False
         self.notifications_enabled = False
         self.auto_mute_apps = []
         self.enable_auto_mute = False
-        self.notifier = ToastNotifier()
+        self.notifications = NotificationDispatcher(create_notification_sinks(icon_path=ASSETS.path(APP_ICON)))
         self.profiles = []
         self.current_profile_index = 0
+        self.current_profile = None
+        self.applied_profile = None
+        self.applied_theme = None
         self.settings = {}
-        self.original_mic_off_icon = QIcon(self.resource_path(os.path.join("images", "mic_off.png")))
-        self.tinted_mic_off_icon = QIcon(self.tint_pixmap(os.path.join("images", "mic_off.png"), "red"))
-        self.mic_on_icon = QIcon(self.resource_path(os.path.join("images", "mic_on.png")))
-        self.setWindowIcon(QIcon(self.resource_path(os.path.join("icons", "mic_switch_icon.ico"))))
-        self.audio_level_signal.connect(self.update_audio_level_visualization)
-        self.initUI()
-        self.load_settings()
-        setup_logging(self.settings.get('enable_logging', True))
-        self.init_device()
-        self.init_tray_icon()
-        self.load_hotkey()
-        self.toggle_mute_signal.connect(self.toggle_mute)
-        self.check_for_updates()  # Check updates on startup
-        self.audio_thread = AudioStreamThread(self)
+        self.settings_store = SettingsStore(SETTINGS_FILE, self.serialize_settings, on_error=self.settings_error_signal.emit)
+        self.settings_error_signal.connect(self.on_settings_error)
+        self.settings_store.start()
+        self.original_mic_off_icon = ASSETS.icon(MIC_OFF_IMAGE)
+        self.tinted_mic_off_icon = ASSETS.icon(MIC_OFF_IMAGE, "red")
+        self.mic_on_icon = ASSETS.icon(MIC_ON_IMAGE)
+        self.setWindowIcon(ASSETS.icon(APP_ICON))
+        self.sound_player = SoundPlayer()
+        self.audio_thread = None
+        self.vad = None
+        self.vad_muted = False
+        self.vad_mute_only = False
+        self.process_watcher = None
+        self.update_checker = None
+        self.process_index = ProcessIndex()
+        with STARTUP_PROFILER.phase("init ui"):
+            self.initUI()
+        with STARTUP_PROFILER.phase("load settings"):
+            self.load_settings()
+        self.init_level_meter()
+        self.configure_logging()
+        with STARTUP_PROFILER.phase("init tray icon"):
+            self.init_tray_icon()
+        self.hotkey_action_signal.connect(self.on_hotkey_action)
+        self.hotkey_recorded_signal.connect(lambda hotkey: self.hotkey_label.setText(f"Recording hotkey: {hotkey}"))
+        self.auto_mute_signal.connect(self.apply_auto_mute)
+        self.update_result_signal.connect(self.on_update_result)
+        self.endpoint_result_signal.connect(self.on_endpoint_result)
+        self.notification_clicked_signal.connect(self.handle_toggle_mute_callback)
+        self.audio_error_signal.connect(lambda message: QMessageBox.critical(self, "Error", message))
+        self.endpoint_state_signal.connect(self.on_endpoint_state)
+        self.backend.subscribe(self.endpoint_state_signal.emit)
+        self.devices_changed_signal.connect(lambda: self.endpoint_worker.submit('devices'))
+        self.voice_activity_signal.connect(self.on_voice_activity)
+        self.digital_silence_signal.connect(self.on_digital_silence)
+        self.backend.subscribe_devices(self.devices_changed_signal.emit)
+        self.deferred_phases = [
+            ("init device", self.init_device),
+            ("load hotkey", self.load_hotkey),
+            ("start audio capture", self.start_audio_capture),
+            ("start auto-mute watcher", self.start_process_watcher),
+            ("check for updates", self.check_for_updates),
+            ("preload sounds", self.preload_sounds)
+        ]
+        QTimer.singleShot(0, self.run_deferred_phase)
+    def notify(self, message: str, key: str = None, duration: float = 5, on_click=None):
+        if not self.notifications.is_alive():
+            self.notifications.start()
+        self.notifications.notify("MicMaster", message, key=key, duration=duration, on_click=on_click)
+    def run_deferred_phase(self):
+        if not self.deferred_phases:
+            logging.info(f"Startup finished in {STARTUP_PROFILER.report()['total_ms']:.1f} ms.")
+            if STARTUP_PROFILER.enabled:
+                print(json.dumps(STARTUP_PROFILER.report(), indent=4))
+                self.quit_app()
+            return
+        name, phase = self.deferred_phases.pop(0)
+        try:
+            with STARTUP_PROFILER.phase(name):
+                phase()
+        except Exception as e:
+            logging.error(f"Error during startup phase '{name}': {e}")
+        QTimer.singleShot(0, self.run_deferred_phase)
+    def preload_sounds(self):
+        if self.use_sound_notification:
+            ASSETS.preload(sounds=(MUTE_SOUND, UNMUTE_SOUND))
+    def start_audio_capture(self):
+        profile = self.get_current_profile()
+        mode = os.environ.get('MICMASTER_ANALYSIS') or self.settings.get('analysis_mode', 'thread')
+        if mode == 'process':
+            self.audio_thread = AnalysisProcess(self.level_pacer, chunk=profile.capture_chunk, rate=profile.capture_rate,
+                                                max_latency_ms=profile.capture_latency_ms,
+                                                load=self.settings.get('analysis_load', 0), on_error=self.audio_error_signal.emit)
+        else:
+            analyzer = SpectrumAnalyzer(load=self.settings['analysis_load']) if self.settings.get('analysis_load') else None
+            self.audio_thread = AudioStreamThread(self.level_pacer, on_error=self.audio_error_signal.emit,
+                                                  chunk=profile.capture_chunk, rate=profile.capture_rate,
+                                                  max_latency_ms=profile.capture_latency_ms, analyzer=analyzer)
         self.audio_thread.start()
+        self.update_capture_demand()
+        self.apply_profile_vad()
+    def update_capture_demand(self):
+        wanted = self.isVisible() and not self.isMinimized() and not self.is_muted
+        if wanted:
+            if not self.meter_timer.isActive():
+                self.level_pacer.discard()
+                self.meter_timer.start()
+            if self.audio_thread:
+                self.audio_thread.add_consumer('meter')
+        else:
+            self.meter_timer.stop()
+            if self.audio_thread:
+                self.audio_thread.remove_consumer('meter')
+            if self.is_muted:
+                self.audio_level_visual.setValue(0)
+                self.audio_level_label.setText("Audio Level: 0%")
+    def start_process_watcher(self):
+        self.process_watcher = ProcessWatcher(self.auto_mute_signal.emit, index=self.process_index)
+        self.process_watcher.start()
+        self.setup_auto_mute()
     def resource_path(self, relative_path: str) -> str:
-        try:
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
-        return os.path.join(base_path, relative_path)
+        return ASSETS.path(relative_path)
     def tint_pixmap(self, pixmap_path: str, color: str) -> QPixmap:
-        pixmap = QPixmap(self.resource_path(pixmap_path))
-        tinted = QPixmap(pixmap.size())
-        tinted.fill(Qt.transparent)
-        painter = QPainter(tinted)
-        painter.drawPixmap(0, 0, pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceAtop)
-        painter.fillRect(tinted.rect(), QColor(color))
-        painter.end()
-        return tinted
+        return ASSETS.pixmap(pixmap_path, color)
     def initUI(self):
         layout = QVBoxLayout()
+        device_layout = QHBoxLayout()
+        self.device_combo = QComboBox(self)
+        self.device_combo.addItem("System Default", None)
+        self.device_combo.activated.connect(self.select_device)
+        self.device_combo.setToolTip("Microphone controlled by MicMaster.")
+        device_layout.addWidget(self.device_combo, 1)
+        self.mute_all_btn = QPushButton("Mute All", self)
+        self.mute_all_btn.clicked.connect(self.mute_all_microphones)
+        self.mute_all_btn.setToolTip("Mute every connected microphone.")
+        device_layout.addWidget(self.mute_all_btn)
+        layout.addLayout(device_layout)
         self.mute_btn = QPushButton("Mute Mic", self)
         self.mute_btn.setIcon(self.original_mic_off_icon)
-        self.mute_btn.clicked.connect(self.toggle_mute)
+        self.mute_btn.clicked.connect(lambda: self.toggle_mute())
         self.mute_btn.setToolTip("Mute/unmute microphone.")
         layout.addWidget(self.mute_btn)
         vol_layout = QHBoxLayout()
@@ -502,6 +3745,7 @@ class MicMaster(QWidget):
         self.volume_slider.setTickInterval(10)
         self.volume_slider.setTickPosition(QSlider.TicksBelow)
         self.volume_slider.valueChanged.connect(self.set_volume)
+        self.volume_slider.sliderReleased.connect(self.commit_volume)
         vol_layout.addWidget(self.volume_slider)
         self.volume_label = QLabel("100%")
         vol_layout.addWidget(self.volume_label)
@@ -521,7 +3765,7 @@ class MicMaster(QWidget):
         self.settings_btn.setToolTip("Open settings.")
         layout.addWidget(self.settings_btn)
         self.check_updates_btn = QPushButton("Check for Updates", self)
-        self.check_updates_btn.clicked.connect(lambda: check_for_updates_notify(self))
+        self.check_updates_btn.clicked.connect(lambda: self.check_for_updates(force=True))
         self.check_updates_btn.setToolTip("Check for updates.")
         layout.addWidget(self.check_updates_btn)
         self.update_status_label = QLabel("")
@@ -558,98 +3802,176 @@ class MicMaster(QWidget):
                      f"- Current Version: {VERSION}")
         QMessageBox.information(self, "MicMaster Help", help_text)
     def apply_theme(self, theme_name: str):
-        if theme_name == 'Dark':
-            self.setStyleSheet("""
-                QWidget { background-color: #1e1e1e; color: #c5c6c7; font-family: "Segoe UI"; font-size: 10pt; }
-                QPushButton { background-color: #282a36; border: 2px solid #44475a; border-radius: 8px; padding: 8px; color: #f8f8f2; }
-                QPushButton:hover { background-color: #44475a; }
-                QPushButton:pressed { background-color: #6272a4; }
-                QSlider::groove:horizontal { height: 8px; background: #44475a; border-radius: 4px; }
-                QSlider::handle:horizontal { background: #50fa7b; border: 1px solid #bd93f9; width: 14px; margin: -3px 0; border-radius: 7px; }
-                QLabel { color: #f8f8f2; }
-                QComboBox { background-color: #282a36; border: 1px solid #44475a; border-radius: 8px; padding: 4px; color: #f8f8f2; }
-                QProgressBar { border: 2px solid #44475a; border-radius: 8px; background-color: #282a36; text-align: center; }
-                QProgressBar::chunk { background-color: #50fa7b; border-radius: 4px; }
-            """)
-            logging.info("Dark theme applied.")
-        else:
-            self.setStyleSheet("""
-                QWidget { background-color: #f5f5f5; color: #2e2e2e; font-family: "Segoe UI"; font-size: 10pt; }
-                QPushButton { background-color: #ffffff; border: 2px solid #c5c5c5; border-radius: 8px; padding: 8px; color: #2e2e2e; }
-                QPushButton:hover { background-color: #e0e0e0; }
-                QPushButton:pressed { background-color: #d5d5d5; }
-                QSlider::groove:horizontal { height: 8px; background: #c5c5c5; border-radius: 4px; }
-                QSlider::handle:horizontal { background: #0078d7; border: 1px solid #005a9e; width: 14px; margin: -3px 0; border-radius: 7px; }
-                QLabel { color: #2e2e2e; }
-                QComboBox { background-color: #ffffff; border: 1px solid #c5c5c5; border-radius: 8px; padding: 4px; color: #2e2e2e; }
-                QProgressBar { border: 2px solid #c5c5c5; border-radius: 8px; background-color: #ffffff; text-align: center; }
-                QProgressBar::chunk { background-color: #0078d7; border-radius: 4px; }
-            """)
-            logging.info("Light theme applied.")
+        theme_name = theme_name if theme_name in THEME_STYLESHEETS else 'Light'
+        if theme_name == self.applied_theme:
+            return
+        self.setStyleSheet(THEME_STYLESHEETS[theme_name])
+        self.applied_theme = theme_name
+        logging.info(f"{theme_name} theme applied.")
     def open_settings(self):
         settings_window = SettingsWindow(self)
         if settings_window.exec_():
-            self.load_settings()
-            self.setup_auto_mute()
+            self.apply_profile_settings()
     def load_settings(self):
         if os.path.exists(SETTINGS_FILE):
             try:
-                with open(SETTINGS_FILE, 'r') as f:
-                    self.settings = json.load(f)
-                self.profiles = list(self.settings.get('profiles', {}).keys())
+                self.settings = migrate_settings(self.settings_store.load())
+                self.settings['profiles'] = {name: Profile.from_dict(data, name)
+                                             for name, data in self.settings['profiles'].items()}
+                self.profiles = list(self.settings['profiles'].keys())
                 if not self.profiles:
                     self.profiles = ['Default']
                     self.settings['profiles'] = {'Default': self.default_profile_settings()}
-                self.current_profile_index = self.settings.get('current_profile', 0)
-                if self.current_profile_index >= len(self.profiles):
-                    self.current_profile_index = 0
+                self.select_profile(self.settings['current_profile'])
                 self.apply_profile_settings()
             except Exception as e:
                 logging.error(f"Error loading settings: {e}")
                 QMessageBox.critical(self, "Error", "Failed to load settings.")
+                self.init_default_settings()
         else:
-            self.settings = {'profiles': {'Default': self.default_profile_settings()}, 'current_profile': 0}
-            self.profiles = ['Default']
-            self.current_profile_index = 0
+            self.init_default_settings()
             self.save_settings()
-    def save_settings(self):
-        try:
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(self.settings, f, indent=4)
-            logging.info("Settings saved.")
-        except Exception as e:
-            logging.error(f"Error saving settings: {e}")
-            QMessageBox.critical(self, "Error", "Failed to save settings.")
-    def default_profile_settings(self) -> dict:
-        return {
-            'volume': 100,
-            'startup': False,
-            'notifications': False,
-            'sound_notifications': False,
-            'theme': 'Dark',
-            'enable_auto_mute': False,
-            'auto_mute_apps': [],
-            'tray_enabled': False,
-            'create_desktop_shortcut': False,
-            'hotkey': None
-        }
-    def get_current_profile(self) -> dict:
-        profile_name = self.profiles[self.current_profile_index]
-        return self.settings['profiles'][profile_name]
-    def apply_profile_settings(self):
+    def init_default_settings(self):
+        self.settings = {'schema_version': SETTINGS_SCHEMA_VERSION,
+                         'profiles': {'Default': self.default_profile_settings()}, 'current_profile': 0}
+        self.profiles = ['Default']
+        self.select_profile(0)
+    def serialize_settings(self) -> str:
+        settings = dict(self.settings)
+        settings['profiles'] = {name: profile.to_dict() for name, profile in self.settings['profiles'].items()}
+        return json.dumps(settings, indent=4)
+    def save_settings(self, *keys):
+        self.settings_store.mark_dirty(*keys)
+    def on_settings_error(self, message: str):
+        QMessageBox.critical(self, "Error", f"Failed to save settings: {message}")
+    def default_profile_settings(self) -> Profile:
+        return Profile()
+    def select_profile(self, index: int):
+        if not isinstance(index, int) or not 0 <= index < len(self.profiles):
+            logging.warning(f"Profile index {index} does not exist; using the first profile.")
+            index = 0
+        self.current_profile_index = index
+        self.current_profile = self.settings['profiles'][self.profiles[index]]
+        self.settings['current_profile'] = index
+    def get_current_profile(self) -> Profile:
+        return self.current_profile
+    PROFILE_APPLIERS = {
+        'volume': 'apply_profile_volume',
+        'sound_notifications': 'apply_profile_notifications',
+        'notifications': 'apply_profile_notifications',
+        'tray_enabled': 'apply_profile_tray',
+        'enable_auto_mute': 'setup_auto_mute',
+        'auto_mute_apps': 'setup_auto_mute',
+        'hotkey': 'apply_profile_hotkey',
+        'hotkey_mode': 'apply_profile_hotkey',
+        'bindings': 'apply_profile_hotkey',
+        'capture_chunk': 'apply_profile_capture',
+        'capture_rate': 'apply_profile_capture',
+        'capture_latency_ms': 'apply_profile_capture',
+        'vad_enabled': 'apply_profile_vad',
+        'vad_silence_seconds': 'apply_profile_vad',
+        'vad_threshold_db': 'apply_profile_vad',
+        'theme': 'apply_profile_theme'
+    }
+    def apply_profile_settings(self, force: bool = False):
         profile = self.get_current_profile()
-        if profile:
-            self.volume_slider.setValue(profile.get('volume', 100))
-            self.use_sound_notification = profile.get('sound_notifications', False)
-            self.notifications_enabled = profile.get('notifications', False)
-            self.tray_enabled = profile.get('tray_enabled', False)
-            self.enable_auto_mute = profile.get('enable_auto_mute', False)
-            self.auto_mute_apps = profile.get('auto_mute_apps', [])
-            self.hotkey = profile.get('hotkey', None)
-            self.apply_theme(profile.get('theme', 'Dark'))
-            logging.info(f"Applied profile: {self.profiles[self.current_profile_index]}")
-        else:
+        if not profile:
             logging.error(f"Profile index {self.current_profile_index} does not exist.")
+            return
+        changed = profile.diff(None if force else self.applied_profile)
+        appliers = []
+        for key in sorted(changed):
+            applier = self.PROFILE_APPLIERS.get(key)
+            if applier and applier not in appliers:
+                appliers.append(applier)
+        for applier in appliers:
+            getattr(self, applier)()
+        self.applied_profile = profile.copy()
+        logging.info(f"Applied profile: {self.profiles[self.current_profile_index]} "
+                     f"({', '.join(sorted(changed)) or 'no changes'}).")
+    def apply_profile_volume(self):
+        self.volume_slider.setValue(self.get_current_profile().volume)
+    def apply_profile_notifications(self):
+        profile = self.get_current_profile()
+        self.use_sound_notification = profile.sound_notifications
+        self.notifications_enabled = profile.notifications
+    def apply_profile_tray(self):
+        self.tray_enabled = self.get_current_profile().tray_enabled
+    def apply_profile_hotkey(self):
+        self.hotkey = self.get_current_profile().hotkey
+        if self.hotkey_dispatcher:
+            self.load_hotkey()
+    def apply_profile_capture(self):
+        profile = self.get_current_profile()
+        if self.audio_thread:
+            self.audio_thread.configure(profile.capture_chunk, profile.capture_rate, profile.capture_latency_ms)
+    def apply_profile_vad(self):
+        profile = self.get_current_profile()
+        if self.audio_thread is None:
+            return
+        if not profile.vad_enabled:
+            if self.vad is not None:
+                self.audio_thread.remove_analyzer(self.vad)
+                self.audio_thread.remove_consumer('vad')
+                self.vad = None
+                self.vad_muted = False
+                self.vad_mute_only = False
+                audio_log.info("Auto-mute on silence disabled.")
+            return
+        if not isinstance(self.audio_thread, AudioStreamThread):
+            audio_log.warning("Auto-mute on silence is not available when audio analysis runs in a separate process.")
+            return
+        if self.vad is None:
+            self.vad = VoiceActivityDetector(on_change=self.voice_activity_signal.emit,
+                                             on_digital_silence=self.digital_silence_signal.emit)
+            self.audio_thread.add_analyzer(self.vad)
+            self.audio_thread.add_consumer('vad')
+        self.vad.configure(threshold_db=profile.vad_threshold_db, hang_over=profile.vad_silence_seconds)
+        audio_log.info(f"Auto-mute after {profile.vad_silence_seconds} s of silence enabled.")
+    def on_voice_activity(self, speaking: bool):
+        if self.vad is None:
+            return
+        if speaking:
+            if self.is_muted and self.vad_muted and not self.vad_mute_only:
+                audio_log.info("Speech detected; unmuting.")
+                self.toggle_mute(self.latency.start('voice'))
+        elif not self.is_muted:
+            audio_log.info("No speech detected; muting.")
+            self.toggle_mute(self.latency.start('voice'))
+            self.vad_muted = True
+            if not self.vad_mute_only:
+                self.vad.watch_silence()
+    def rearm_vad(self):
+        if self.vad is not None:
+            self.vad.reset()
+    def on_digital_silence(self):
+        if self.vad is None or not (self.is_muted and self.vad_muted) or self.vad_mute_only:
+            return
+        self.vad_mute_only = True
+        audio_log.warning("The microphone delivers only silence while muted; speech can no longer unmute it.")
+        self.notify("This microphone is silent while muted, so speech cannot unmute it. "
+                    "Auto-mute will only mute; unmute it yourself.", key='vad', duration=10)
+    def apply_profile_theme(self):
+        self.apply_theme(self.get_current_profile().theme)
+    def switch_profile(self, index: int) -> bool:
+        if not isinstance(index, int) or not 0 <= index < len(self.profiles):
+            logging.error(f"Invalid profile index: {index}.")
+            return False
+        if index == self.current_profile_index:
+            return True
+        start = time.perf_counter()
+        self.select_profile(index)
+        self.load_current_profile()
+        self.save_settings('current_profile')
+        elapsed = (time.perf_counter() - start) * 1000.0
+        self.latency.record('profile switch', elapsed)
+        logging.info(f"Switched to profile '{self.profiles[index]}' in {elapsed:.1f} ms.")
+        return True
+    def switch_profile_by_name(self, name: str) -> bool:
+        if name not in self.profiles:
+            logging.error(f"Profile '{name}' does not exist.")
+            return False
+        return self.switch_profile(self.profiles.index(name))
     def add_to_startup(self):
         try:
             exe_path = sys.executable if getattr(sys, 'frozen', False) else os.path.abspath(sys.argv[0])
@@ -661,7 +3983,7 @@ class MicMaster(QWidget):
             shortcut.Targetpath = exe_path
             shortcut.Arguments = ""
             shortcut.WorkingDirectory = os.path.dirname(exe_path)
-            shortcut.IconLocation = self.resource_path(os.path.join("icons", "mic_switch_icon.ico"))
+            shortcut.IconLocation = self.resource_path(APP_ICON)
             shortcut.save()
             logging.info("Added to startup.")
         except Exception as e:
@@ -678,25 +4000,127 @@ class MicMaster(QWidget):
             logging.error(f"Error removing from startup: {e}")
             QMessageBox.critical(self, "Error", "Failed to remove startup entry.")
     def init_device(self):
+        self.backend.devices.selected_id = self.settings.get('device_id')
+        self.endpoint_worker.start()
+        self.endpoint_worker.submit('open')
+    def on_endpoint_result(self, kind: str, result, error, traces: list):
+        if kind == 'open':
+            if error is not None:
+                mic_log.error(f"Error initializing microphone control: {error}")
+                self.show_endpoint_error("Failed to initialize microphone control.")
+            elif result is None:
+                mic_log.error("No microphone found.")
+                self.show_endpoint_error("No microphone found.")
+            else:
+                mic_log.info(f"Microphone backend '{self.backend.name}' initialized.")
+                self.apply_endpoint_snapshot(result)
+                if not self.volume_controller.is_alive():
+                    self.volume_controller.start()
+        elif kind == 'state':
+            if error is not None:
+                mic_log.error(f"Error reading microphone state: {error}")
+            elif self.endpoint_busy():
+                self.endpoint_recheck_timer.start()
+            elif result is not None and result.current_id is not None:
+                self.on_endpoint_state(result.muted, result.level)
+        elif kind in ('select', 'devices'):
+            if error is not None:
+                mic_log.error(f"Error switching microphone: {error}")
+                self.show_endpoint_error("Failed to switch microphone.")
+            elif result is not None:
+                self.apply_endpoint_snapshot(result)
+        elif error is not None:
+            mic_log.error(f"Error {'setting volume' if kind == 'volume' else 'controlling microphone'}: {error}")
+            self.show_endpoint_error("Failed to set volume." if kind == 'volume' else "Failed to control microphone.")
+        elif result is not None:
+            if kind == 'mute':
+                mic_log.info(f"Microphone {'muted' if result else 'unmuted'}.")
+            elif kind == 'mute_all':
+                mic_log.info(f"Muted {result} microphone(s).")
+            else:
+                mic_log.debug(f"Volume set to {int(round(result * 100))}%.", extra={'rate_limit': True})
+        for trace in traces:
+            trace.mark('applied')
+            self.latency.finish(trace)
+    def apply_endpoint_snapshot(self, snapshot: EndpointSnapshot):
+        previous_id, self.current_device_id = self.current_device_id, snapshot.current_id
+        self.device_combo.blockSignals(True)
+        self.device_combo.clear()
+        self.device_combo.addItem("System Default", None)
+        for endpoint in snapshot.endpoints:
+            self.device_combo.addItem(f"{endpoint.name} (default)" if endpoint.is_default else endpoint.name, endpoint.id)
+        self.device_combo.setCurrentIndex(max(0, self.device_combo.findData(self.backend.devices.selected_id)))
+        self.device_combo.blockSignals(False)
+        if snapshot.current_id is None:
+            mic_log.warning("No microphone connected.")
+            return
+        if previous_id is not None and snapshot.current_id != previous_id:
+            name = next((endpoint.name for endpoint in snapshot.endpoints if endpoint.id == snapshot.current_id), snapshot.current_id)
+            mic_log.info(f"Now controlling microphone '{name}'.")
+        if snapshot.muted != self.is_muted:
+            self.is_muted = snapshot.muted
+            self.vad_muted = False
+            self.rearm_vad()
+            self.show_mute_state()
+        current_volume = int(round(snapshot.level * 100))
+        self.volume_controller.sync(snapshot.level)
+        self.volume_slider.blockSignals(True)
+        self.volume_slider.setValue(current_volume)
+        self.volume_slider.blockSignals(False)
+        self.volume_label.setText(f"{current_volume}%")
+    def select_device(self, index: int):
+        endpoint_id = self.device_combo.itemData(index)
+        self.volume_controller.cancel()
+        self.vad_mute_only = False
+        self.endpoint_worker.submit('select', endpoint_id)
+        self.settings['device_id'] = endpoint_id
+        self.save_settings('device_id')
+    def mute_all_microphones(self):
+        trace = self.latency.start('mute all')
+        self.volume_controller.cancel()
+        trace.mark('queued')
+        self.endpoint_worker.submit('mute_all', True, trace)
+        if not self.is_muted:
+            self.is_muted = True
+            self.vad_muted = False
+            self.rearm_vad()
+            self.show_mute_state()
+            self.send_notification()
+    def endpoint_busy(self) -> bool:
+        return self.endpoint_worker.busy('mute') or self.endpoint_worker.busy('volume') or self.volume_controller.busy()
+    def recheck_endpoint_state(self):
+        if self.endpoint_busy():
+            self.endpoint_recheck_timer.start()
+        else:
+            self.endpoint_worker.submit('state')
+    def on_endpoint_state(self, muted: bool, level: float):
+        if self.endpoint_busy():
+            self.endpoint_recheck_timer.start()
+            return
+        if muted != self.is_muted:
+            mic_log.info(f"Microphone {'muted' if muted else 'unmuted'} outside MicMaster.")
+            self.is_muted = muted
+            self.vad_muted = False
+            self.rearm_vad()
+            self.show_mute_state()
+        value = int(round(level * 100))
+        if value != self.volume_slider.value() and not self.volume_slider.isSliderDown():
+            mic_log.info(f"Microphone volume changed to {value}% outside MicMaster.", extra={'rate_limit': True})
+            self.volume_controller.sync(level)
+            self.volume_slider.blockSignals(True)
+            self.volume_slider.setValue(value)
+            self.volume_slider.blockSignals(False)
+            self.volume_label.setText(f"{value}%")
+    def show_endpoint_error(self, message: str):
+        if self.endpoint_error_shown:
+            return
+        self.endpoint_error_shown = True
         try:
-            pythoncom.CoInitialize()
-            devices = AudioUtilities.GetMicrophone()
-            if not devices:
-                logging.error("No microphone found.")
-                QMessageBox.critical(self, "Error", "No microphone found.")
-                return
-            self.device = devices
-            self.interface = self.device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            self.volume = cast(self.interface, POINTER(IAudioEndpointVolume))
-            current_volume = self.volume.GetMasterVolumeLevelScalar() * 100
-            self.volume_slider.setValue(int(current_volume))
-            self.volume_label.setText(f"{int(current_volume)}%")
-        except Exception as e:
-            logging.error(f"Error initializing microphone control: {e}")
-            QMessageBox.critical(self, "Error", "Failed to initialize microphone control.")
+            QMessageBox.critical(self, "Error", message)
+        finally:
+            self.endpoint_error_shown = False
     def init_tray_icon(self):
-        tray_icon_path = self.resource_path(os.path.join("icons", "mic_switch_icon.ico"))
-        self.tray_icon = QSystemTrayIcon(QIcon(tray_icon_path), self)
+        self.tray_icon = QSystemTrayIcon(ASSETS.icon(APP_ICON), self)
         tray_menu = QMenu(self)
         restore_action = QAction("Restore", self)
         restore_action.triggered.connect(self.show_normal)
@@ -704,9 +4128,11 @@ class MicMaster(QWidget):
         quit_action = QAction("Quit", self)
         quit_action.triggered.connect(self.quit_app)
         tray_menu.addAction(quit_action)
-        switch_profile_action = QAction("Switch Profile", self)
-        switch_profile_action.triggered.connect(lambda: self.open_settings())
-        tray_menu.addAction(switch_profile_action)
+        mute_all_action = QAction("Mute All Microphones", self)
+        mute_all_action.triggered.connect(self.mute_all_microphones)
+        tray_menu.addAction(mute_all_action)
+        self.profile_menu = tray_menu.addMenu("Switch Profile")
+        self.profile_menu.aboutToShow.connect(self.populate_profile_menu)
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.activated.connect(self.on_tray_icon_activated)
         if self.tray_enabled:
@@ -715,6 +4141,13 @@ class MicMaster(QWidget):
             self.tray_icon.showMessage("MicMaster", "Minimized to tray", QSystemTrayIcon.Information, 2000)
         elif self.tray_icon:
             self.tray_icon.hide()
+    def populate_profile_menu(self):
+        self.profile_menu.clear()
+        for index, name in enumerate(self.profiles):
+            action = self.profile_menu.addAction(name)
+            action.setCheckable(True)
+            action.setChecked(index == self.current_profile_index)
+            action.triggered.connect(lambda checked, index=index: self.switch_profile(index))
     def on_tray_icon_activated(self, reason):
         if reason == QSystemTrayIcon.Trigger:
             self.show_normal()
@@ -724,8 +4157,8 @@ class MicMaster(QWidget):
     def toggle_tray_option(self, state):
         self.tray_enabled = (state == Qt.Checked)
         profile = self.get_current_profile()
-        profile['tray_enabled'] = self.tray_enabled
-        self.save_settings()
+        profile.tray_enabled = self.tray_enabled
+        self.save_settings('profiles')
         if self.tray_enabled:
             self.init_tray_icon()
         else:
@@ -734,160 +4167,187 @@ class MicMaster(QWidget):
     def changeEvent(self, event):
         if event.type() == QEvent.WindowStateChange and self.isMinimized():
             profile = self.get_current_profile()
-            if profile.get('tray_enabled', False):
+            if profile.tray_enabled:
                 QTimer.singleShot(0, self.hide)
                 self.tray_icon.showMessage("MicMaster", "Minimized to tray", QSystemTrayIcon.Information, 2000)
         super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.update_capture_demand()
     def closeEvent(self, event):
-        self.audio_thread.stop()
-        self.audio_thread.join()
+        self.stop_services()
         event.accept()
     def quit_app(self):
         if self.tray_icon:
             self.tray_icon.hide()
-        self.audio_thread.stop()
-        self.audio_thread.join()
+        self.stop_services()
         QApplication.quit()
     def start_recording(self):
-        if getattr(self, 'recording', False):
+        if self.recording or not self.hotkey_dispatcher:
             return
         self.recording = True
-        self.pressed_keys = set()
         self.hotkey_label.setStyleSheet("color: red;")
         self.hotkey_label.setText("Recording hotkey... Press 'Stop Recording'.")
-        keyboard.hook(self.record_key)
+        self.hotkey_dispatcher.start_recording(self.hotkey_recorded_signal.emit)
     def stop_recording(self):
-        if not getattr(self, 'recording', False):
+        if not self.recording:
             self.hotkey_label.setText("No recording in progress.")
             return
         self.recording = False
         self.hotkey_label.setStyleSheet("color: white;")
-        keyboard.unhook_all()
-        if not self.pressed_keys:
+        hotkey = self.hotkey_dispatcher.stop_recording()
+        if not hotkey:
             self.hotkey_label.setText("Error: No keys recorded.")
             return
-        self.hotkey = "+".join(sorted(self.pressed_keys))
-        if self.current_hotkey:
-            try:
-                keyboard.remove_hotkey(self.current_hotkey)
-                logging.info(f"Removed previous hotkey: {self.current_hotkey}")
-            except ValueError:
-                logging.warning(f"Hotkey {self.current_hotkey} not found.")
+        profile = self.get_current_profile()
         try:
-            self.current_hotkey = keyboard.add_hotkey(self.hotkey, self.emit_toggle_mute_signal)
+            self.hotkey_dispatcher.bind(self.hotkey_bindings(profile, hotkey))
+            self.hotkey = hotkey
             self.hotkey_label.setText(f"Recorded Hotkey: {self.hotkey}")
-            logging.info(f"Hotkey recorded: {self.hotkey}")
-            profile = self.get_current_profile()
-            profile['hotkey'] = self.hotkey
-            self.save_settings()
+            hotkey_log.info(f"Hotkey recorded: {self.hotkey}")
+            profile.hotkey = self.hotkey
+            self.save_settings('profiles')
         except Exception as e:
-            logging.error(f"Error setting hotkey: {e}")
+            hotkey_log.error(f"Error setting hotkey: {e}")
             self.hotkey_label.setText("Error: Invalid hotkey.")
-    @pyqtSlot()
-    def emit_toggle_mute_signal(self):
-        try:
-            self.toggle_mute_signal.emit()
-            logging.info("Toggle mute signal emitted.")
-        except Exception as e:
-            logging.error(f"Error emitting toggle signal: {e}")
-    def record_key(self, e):
-        if e.event_type == "down" and e.name not in self.pressed_keys:
-            self.pressed_keys.add(e.name)
-            self.hotkey_label.setText(f"Recording hotkey: {' + '.join(sorted(self.pressed_keys))}")
+    def on_hotkey_action(self, action: str, trace: LatencyTrace = None):
+        if action == 'toggle_mute':
+            self.toggle_mute(trace)
+        elif action in ('mute', 'unmute'):
+            if self.is_muted != (action == 'mute'):
+                self.toggle_mute(trace)
+        else:
+            hotkey_log.warning(f"Unknown hotkey action: {action}")
+    def hotkey_bindings(self, profile: Profile, hotkey: str = None) -> dict:
+        bindings = dict(profile.bindings)
+        hotkey = hotkey or profile.hotkey
+        if hotkey:
+            bindings[hotkey] = 'push_to_talk' if profile.hotkey_mode == 'hold' else 'toggle_mute'
+        return bindings
     def load_hotkey(self):
+        if self.hotkey_dispatcher is None:
+            self.hotkey_dispatcher = HotkeyDispatcher(self.hotkey_action_signal.emit, tracker=self.latency)
         profile = self.get_current_profile()
-        hotkey = profile.get('hotkey', None)
-        if hotkey:
-            self.hotkey = hotkey
-            try:
-                self.hotkey_listener = HotkeyListener(self.emit_toggle_mute_signal, self.hotkey)
-                self.hotkey_listener.start()
-                self.hotkey_label.setText(f"Recorded Hotkey: {self.hotkey}")
-                logging.info(f"Hotkey loaded: {self.hotkey}")
-            except Exception as e:
-                logging.error(f"Error loading hotkey: {e}")
-                self.hotkey_label.setText("Error: Invalid hotkey.")
+        self.hotkey = profile.hotkey
+        try:
+            self.hotkey_dispatcher.bind(self.hotkey_bindings(profile))
+            self.hotkey_label.setText(f"Recorded Hotkey: {self.hotkey}")
+            if self.hotkey:
+                hotkey_log.info(f"Hotkey loaded: {self.hotkey}")
+        except Exception as e:
+            hotkey_log.error(f"Error loading hotkey: {e}")
+            self.hotkey_label.setText("Error: Invalid hotkey.")
     def setup_auto_mute(self):
         profile = self.get_current_profile()
-        self.enable_auto_mute = profile.get('enable_auto_mute', False)
-        self.auto_mute_apps = profile.get('auto_mute_apps', [])
-    def check_auto_mute_apps(self):
-        if not self.auto_mute_apps or not self.enable_auto_mute:
-            return
-        try:
-            running_apps = [proc.name().lower() for proc in psutil.process_iter()]
-            should_mute = any(app.lower() in running_apps for app in self.auto_mute_apps)
-            if should_mute and not self.is_muted:
-                self.toggle_mute()
-            elif not should_mute and self.is_muted:
-                self.toggle_mute()
-        except Exception as e:
-            logging.error(f"Error checking auto-mute: {e}")
-    def toggle_mute(self):
+        self.enable_auto_mute = profile.enable_auto_mute
+        self.auto_mute_apps = profile.auto_mute_apps
+        if self.process_watcher:
+            self.process_watcher.set_apps(self.auto_mute_apps if self.enable_auto_mute else [])
+    def apply_auto_mute(self, should_mute: bool):
+        if should_mute != self.is_muted:
+            automute_log.info(f"Auto-mute: {'muting' if should_mute else 'unmuting'} microphone.")
+            self.toggle_mute(self.latency.start('auto-mute'))
+    def toggle_mute(self, trace: LatencyTrace = None):
+        if trace is None:
+            trace = self.latency.start('ui')
+        trace.mark('slot')
+        self.vad_muted = False
+        if trace.source != 'voice':
+            self.rearm_vad()
         try:
-            pythoncom.CoInitialize()
             self.is_muted = not self.is_muted
-            self.mute_btn.setText("Unmute Mic" if self.is_muted else "Mute Mic")
-            self.mute_btn.setIcon(self.tinted_mic_off_icon if self.is_muted else self.mic_on_icon)
-            self.mute_microphone(self.is_muted)
+            trace.mark('queued')
+            self.mute_microphone(self.is_muted, trace)
+            self.show_mute_state()
             self.send_notification()
-            logging.info(f"Microphone {'muted' if self.is_muted else 'unmuted'}.")
-            if self.tray_icon:
-                path = self.resource_path(os.path.join("images", "mic_off.png")) if self.is_muted else self.resource_path(os.path.join("images", "mic_on.png"))
-                self.tray_icon.setIcon(QIcon(path))
         except Exception as e:
-            logging.error(f"Error toggling mute: {e}")
+            mic_log.error(f"Error toggling mute: {e}")
             QMessageBox.critical(self, "Error", "Failed to toggle microphone.")
+    def show_mute_state(self):
+        self.mute_btn.setText("Unmute Mic" if self.is_muted else "Mute Mic")
+        self.mute_btn.setIcon(self.tinted_mic_off_icon if self.is_muted else self.mic_on_icon)
+        if self.tray_icon:
+            self.tray_icon.setIcon(self.original_mic_off_icon if self.is_muted else self.mic_on_icon)
+        self.update_capture_demand()
     def send_notification(self):
         status = "Muted" if self.is_muted else "Unmuted"
         if self.use_sound_notification:
-            sound_file = os.path.join("sounds", "mute_sound.wav") if self.is_muted else os.path.join("sounds", "unmute_sound.wav")
-            try:
-                winsound.PlaySound(self.resource_path(sound_file), winsound.SND_FILENAME | winsound.SND_ASYNC)
-            except Exception as e:
-                logging.error(f"Error playing sound: {e}")
-                winsound.MessageBeep(winsound.MB_ICONEXCLAMATION if self.is_muted else winsound.MB_OK)
+            if not self.sound_player.is_alive():
+                self.sound_player.start()
+            self.sound_player.play(MUTE_SOUND if self.is_muted else UNMUTE_SOUND, self.is_muted)
         elif self.notifications_enabled:
-            try:
-                self.notifier.show_toast("MicMaster", f"Microphone {status}",
-                                         icon_path=self.resource_path(os.path.join("icons", "mic_switch_icon.ico")),
-                                         duration=5, threaded=True,
-                                         callback_on_click=self.handle_toggle_mute_callback)
-            except Exception as e:
-                logging.error(f"Error showing notification: {e}")
-                notification.notify(title="MicMaster", message=f"Microphone {status}", timeout=2)
+            self.notify(f"Microphone {status}", key='mute', duration=2, on_click=self.on_notification_clicked)
+    def on_notification_clicked(self):
+        self.notification_clicked_signal.emit()
+        return 0
     def handle_toggle_mute_callback(self):
         try:
-            self.toggle_mute()
+            self.toggle_mute(self.latency.start('notification'))
             logging.info("Toggled via notification.")
         except Exception as e:
             logging.error(f"Error in notification callback: {e}")
-        return 0
-    def mute_microphone(self, mute: bool):
-        try:
-            if self.volume:
-                self.volume.SetMute(1 if mute else 0, None)
-                logging.info(f"Microphone {'muted' if mute else 'unmuted'}.")
-        except Exception as e:
-            logging.error(f"Error controlling microphone: {e}")
-            QMessageBox.critical(self, "Error", "Failed to control microphone.")
+    def mute_microphone(self, mute: bool, trace: LatencyTrace = None):
+        profile = self.get_current_profile()
+        fade = profile.mute_fade_ms / 1000.0 if profile else 0.0
+        level = self.volume_slider.value() / 100.0
+        controller = self.volume_controller
+        if fade <= 0 or not controller.is_alive():
+            controller.cancel()
+            self.endpoint_worker.submit('mute', mute, trace)
+            if not mute and controller.level is not None and controller.level != level:
+                controller.commit(level)
+        elif mute:
+            current = controller.level if controller.level is not None else level
+            def on_done():
+                self.endpoint_worker.submit('mute', True, trace)
+                controller.commit(level)
+            controller.ramp(current, 0.0, fade, on_done=on_done)
+        else:
+            controller.ramp(0.0, level, fade, on_start=lambda: self.endpoint_worker.submit('mute', False, trace))
     def set_volume(self, value: int):
-        if self.volume:
-            vol_level = value / 100.0
-            try:
-                self.volume.SetMasterVolumeLevelScalar(vol_level, None)
-                self.volume_label.setText(f"{value}%")
-                logging.info(f"Volume set to {value}%.")
-            except Exception as e:
-                logging.error(f"Error setting volume: {e}")
-                QMessageBox.critical(self, "Error", "Failed to set volume.")
-    def update_audio_level_visualization(self, level: int):
+        self.volume_label.setText(f"{value}%")
+        self.volume_controller.request(value / 100.0)
+    def commit_volume(self):
+        value = self.volume_slider.value()
+        self.volume_controller.commit(value / 100.0)
+        mic_log.info(f"Volume set to {value}%.", extra={'rate_limit': True})
+    def init_level_meter(self):
+        self.level_pacer = LevelPacer(self.settings.get('meter_refresh_rate', 20),
+                                      self.settings.get('meter_change_threshold', 1))
+        self.meter_timer = QTimer(self)
+        self.meter_timer.setInterval(self.level_pacer.interval_ms)
+        self.meter_timer.timeout.connect(self.update_audio_level_visualization)
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_capture_demand()
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_capture_demand()
+    def update_audio_level_visualization(self):
+        if self.audio_thread:
+            self.audio_thread.poll()
+        level = self.level_pacer.take()
+        if level is None:
+            return
         self.audio_level_visual.setValue(level)
         self.audio_level_label.setText(f"Audio Level: {level}%")
-    def check_for_updates(self):
-        if hasattr(self, 'check_updates_btn') and self.check_updates_btn is not None:
-            self.check_updates_btn.setEnabled(False)
-        check_for_updates_notify(self)
+    def check_for_updates(self, force: bool = False):
+        if self.update_checker and self.update_checker.is_alive():
+            return
+        self.check_updates_btn.setEnabled(False)
+        self.update_status_label.setText("Checking for updates...")
+        url = os.environ.get('MICMASTER_UPDATE_URL') or self.settings.get('update_url', UPDATE_URL)
+        self.update_checker = UpdateChecker(self.update_result_signal.emit, url=url, force=force)
+        self.update_checker.start()
+    def on_update_result(self, result: UpdateResult):
+        self.check_updates_btn.setEnabled(True)
+        self.update_status_label.setText(result.message)
+        if result.status == 'update':
+            msg = (f"New version {result.latest_version} available.\n"
+                   f"You have {VERSION}.\n"
+                   "Please download the latest version from:\n" + result.download_url)
+            QMessageBox.information(self, "Update Available", msg)
+        elif result.status == 'latest':
+            update_log.info("Latest version in use.")
     def create_desktop_shortcut_method(self):
         try:
             exe_path = sys.executable if getattr(sys, 'frozen', False) else os.path.abspath(sys.argv[0])
@@ -900,17 +4360,12 @@ class MicMaster(QWidget):
                 shortcut.Targetpath = exe_path
                 shortcut.Arguments = ""
                 shortcut.WorkingDirectory = os.path.dirname(exe_path)
-                icon_location = self.resource_path(os.path.join("icons", "mic_switch_icon.ico"))
+                icon_location = self.resource_path(APP_ICON)
                 if os.path.exists(icon_location):
                     shortcut.IconLocation = icon_location
                 shortcut.save()
                 logging.info("Desktop shortcut created.")
-                try:
-                    self.notifier.show_toast("MicMaster", "Desktop shortcut created.",
-                                               icon_path=self.resource_path(os.path.join("icons", "mic_switch_icon.ico")),
-                                               duration=2, threaded=True)
-                except Exception as e:
-                    logging.error(f"Error showing notification: {e}")
+                self.notify("Desktop shortcut created.", duration=2)
             else:
                 logging.info("Desktop shortcut already exists.")
         except Exception as e:
@@ -931,31 +4386,44 @@ class MicMaster(QWidget):
     def load_current_profile(self):
         try:
             self.apply_profile_settings()
-            setup_logging(self.settings.get('enable_logging', True))
-            self.setup_auto_mute()
-            self.load_hotkey()
         except Exception as e:
             logging.error(f"Error loading profile: {e}")
             QMessageBox.critical(self, "Error", "Failed to load profile.")
-            self.current_profile_index = 0
-            self.settings['current_profile'] = 0
-            self.apply_profile_settings()
+            self.select_profile(0)
+            self.apply_profile_settings(force=True)
     def get_profiles(self) -> list:
         return self.profiles
+    def configure_logging(self):
+        setup_logging(self.settings.get('enable_logging', True), self.settings.get('log_levels'))
+    def stop_services(self):
+        self.endpoint_recheck_timer.stop()
+        self.deferred_phases = []
+        if self.hotkey_dispatcher:
+            self.hotkey_dispatcher.close()
+        self.settings_store.close()
+        if self.process_watcher:
+            self.process_watcher.stop()
+        if self.audio_thread:
+            self.audio_thread.stop()
+            self.audio_thread.join()
+        self.volume_controller.stop()
+        self.sound_player.stop()
+        self.notifications.stop()
+        self.endpoint_worker.stop()
+        shutdown_logging()
     def closeEvent(self, event):
-        self.audio_thread.stop()
-        self.audio_thread.join()
+        self.stop_services()
         event.accept()
     def quit_app(self):
         if self.tray_icon:
             self.tray_icon.hide()
-        self.audio_thread.stop()
-        self.audio_thread.join()
+        self.stop_services()
         QApplication.quit()
 
 class MicMasterApp:
-    def __init__(self):
-        self.app = QApplication(sys.argv)
+    def __init__(self, argv: list, profile: str = None):
+        with STARTUP_PROFILER.phase("create application"):
+            self.app = QApplication(argv)
         icons_dir = os.path.join(os.path.dirname(__file__), "icons")
         if not os.path.exists(icons_dir):
             setup_logging(True)
@@ -969,14 +4437,39 @@ class MicMasterApp:
             QMessageBox.critical(None, "Error", "Application icon not found.")
             sys.exit(1)
         self.app.setWindowIcon(QIcon(icon_path))
-        self.window = MicMaster()
-        self.window.show()
+        with STARTUP_PROFILER.phase("create window"):
+            self.window = MicMaster()
+        if profile:
+            self.window.switch_profile_by_name(profile)
+        with STARTUP_PROFILER.phase("show window"):
+            self.window.show()
     def run(self):
         sys.exit(self.app.exec_())
 
+def parse_args(argv: list):
+    parser = argparse.ArgumentParser(prog='MicMaster')
+    parser.add_argument('--benchmark', choices=sorted(BENCHMARKS), help="Run a headless benchmark and print the results as JSON.")
+    parser.add_argument('--backend', choices=['pycaw', 'fake'], default=None, help="Microphone backend used by benchmarks.")
+    parser.add_argument('--latency-ms', type=float, default=None, help="Injected per-call latency for the fake backend.")
+    parser.add_argument('--iterations', type=int, default=1000, help="Benchmark iterations.")
+    parser.add_argument('--profile', default=None, help="Switch to the named profile on startup.")
+    parser.add_argument('--profile-startup', action='store_true', help="Print per-phase import and init timings as JSON, then exit.")
+    parser.add_argument('--log-lines', type=int, default=1000000, help="Generated log lines for the log index benchmark.")
+    parser.add_argument('--seconds', type=float, default=3.0, help="Run time for the capture benchmark.")
+    parser.add_argument('--jitter-ms', type=float, default=15.0, help="Injected scheduling jitter for the synthetic capture source.")
+    parser.add_argument('--analysis-load', type=int, default=20, help="Spectrum passes per chunk for the analysis benchmark.")
+    parser.add_argument('--wav', default=None, help="16-bit PCM WAV file for the voice detection benchmark.")
+    parser.add_argument('--vad-silence', type=float, default=1.0, help="Silence before auto-mute in the voice detection benchmark.")
+    parser.add_argument('--processes', type=int, default=5000, help="Synthetic process count for the watcher benchmark.")
+    return parser.parse_known_args(argv)
+
 def main():
-    pythoncom.CoInitialize()
-    app_instance = MicMasterApp()
+    multiprocessing.freeze_support()
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.benchmark:
+        sys.exit(run_benchmark(args))
+    STARTUP_PROFILER.enabled = args.profile_startup
+    app_instance = MicMasterApp(sys.argv[:1] + qt_args, args.profile)
     app_instance.run()
 
 if __name__ == '__main__':
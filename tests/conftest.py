@@ -0,0 +1,45 @@
+import os
+import socket
+import sys
+import time
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+@pytest.fixture
+def pump(qapp):
+    def run(seconds: float = 0.0):
+        deadline = time.monotonic() + seconds
+        qapp.processEvents()
+        while time.monotonic() < deadline:
+            time.sleep(0.01)
+            qapp.processEvents()
+    return run
+
+@pytest.fixture
+def window(pump, tmp_path, monkeypatch):
+    import MicMaster
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('MICMASTER_BACKEND', 'fake')
+    monkeypatch.setenv('MICMASTER_CAPTURE', 'synthetic')
+    monkeypatch.setenv('MICMASTER_INPUT', 'fake')
+    monkeypatch.setenv('MICMASTER_UPDATE_URL', f'http://127.0.0.1:{port}/latest')
+    monkeypatch.setattr(MicMaster.QMessageBox, 'critical', staticmethod(lambda *args, **kwargs: None))
+    monkeypatch.setattr(MicMaster.QMessageBox, 'information', staticmethod(lambda *args, **kwargs: None))
+    window = MicMaster.MicMaster()
+    deadline = time.monotonic() + 10.0
+    while (window.deferred_phases or not window.volume_controller.is_alive()) and time.monotonic() < deadline:
+        pump(0.02)
+    yield window
+    window.stop_services()
+    pump()
@@ -0,0 +1,29 @@
+import time
+from queue import Queue
+
+from MicMaster import AnalysisProcess, LevelPacer
+
+def run_capture(source_name: str, seconds: float, stop_on_error: bool = False):
+    errors = Queue()
+    pacer = LevelPacer()
+    capture = AnalysisProcess(pacer, source_name, on_error=errors.put)
+    capture.start()
+    try:
+        capture.add_consumer('test')
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline and not (stop_on_error and errors.qsize()):
+            capture.poll()
+            time.sleep(0.05)
+    finally:
+        capture.stop()
+        capture.join()
+    return errors, pacer
+
+def test_capture_failure_in_child_is_reported():
+    errors, _ = run_capture('missing', 15.0, stop_on_error=True)
+    assert errors.get_nowait() == "Failed to open audio stream."
+
+def test_working_capture_reports_no_error():
+    errors, pacer = run_capture('synthetic', 3.0)
+    assert pacer.pushed > 0
+    assert errors.empty()
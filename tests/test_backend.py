@@ -0,0 +1,33 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WINDOWS_ONLY = ('winsound', 'pythoncom', 'comtypes', 'pycaw', 'win10toast_click', 'keyboard', 'pyaudio')
+
+def run_without_windows_modules(code: str) -> subprocess.CompletedProcess:
+    blocker = f"import sys\nfor name in {WINDOWS_ONLY!r}:\n    sys.modules[name] = None\n"
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    return subprocess.run([sys.executable, '-c', blocker + code], cwd=ROOT, env=env, capture_output=True, text=True, timeout=60)
+
+def test_import_does_not_need_windows_modules():
+    result = run_without_windows_modules("import MicMaster\n")
+    assert result.returncode == 0, result.stderr
+
+def test_fake_backend_benchmark_runs_without_windows_modules():
+    code = "import sys, MicMaster\nsys.argv = ['MicMaster.py', '--benchmark', 'backend', '--backend', 'fake', '--iterations', '20']\nMicMaster.main()\n"
+    result = run_without_windows_modules(code)
+    assert result.returncode == 0, result.stderr
+    output = json.loads(result.stdout)
+    assert output['backend'] == 'fake'
+    assert output['iterations'] == 20
+
+def test_fake_backend_toggles_mute():
+    from MicMaster import create_backend
+    backend = create_backend('fake')
+    assert backend.open()
+    backend.set_mute(True)
+    assert backend.get_mute() is True
+    backend.set_volume(0.25)
+    assert backend.get_volume() == 0.25
@@ -0,0 +1,74 @@
+import time
+
+from MicMaster import AudioEndpointWorker, FakeMicBackend, VolumeController
+
+def start_worker(latency: float = 0.0):
+    backend = FakeMicBackend(latency)
+    worker = AudioEndpointWorker(backend)
+    worker.start()
+    worker.submit('open')
+    deadline = time.monotonic() + 5.0
+    while 'open' not in worker.last_executed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return backend, worker
+
+def test_stop_flushes_queued_mute_and_volume():
+    backend, worker = start_worker(latency=0.1)
+    controller = VolumeController(lambda level: worker.submit('volume', level))
+    controller.start()
+    worker.submit('volume', 0.9)
+    controller.commit(0.5)
+    worker.submit('mute', True)
+    controller.stop()
+    worker.stop()
+    assert not worker.is_alive()
+    assert backend.states['fake-capture-0'] == [True, 0.5]
+    assert not backend.available
+
+def test_stop_drops_commands_that_are_not_drained():
+    backend, worker = start_worker(latency=0.1)
+    worker.submit('volume', 0.3)
+    worker.submit('devices')
+    worker.stop()
+    assert backend.states['fake-capture-0'][1] == 0.3
+    assert 'devices' not in worker.last_executed
+
+def test_stop_gives_up_after_the_timeout():
+    backend, worker = start_worker(latency=0.4)
+    for level in (0.1, 0.2):
+        worker.submit('volume', level)
+    worker.submit('mute', True)
+    start = time.monotonic()
+    worker.stop(timeout=0.1)
+    assert time.monotonic() - start < 2.0
+
+def test_quit_applies_pending_mute_and_volume(window):
+    window.backend.latency = 0.15
+    window.volume_slider.setValue(50)
+    window.commit_volume()
+    window.toggle_mute()
+    window.quit_app()
+    assert window.backend.states['fake-capture-0'] == [True, 0.5]
+
+def test_external_unmute_during_settle_window_is_not_lost(window, pump):
+    window.toggle_mute()
+    pump(0.1)
+    assert window.endpoint_busy()
+    window.backend.simulate_external_change(muted=False)
+    pump(2.0)
+    assert not window.is_muted
+    assert window.backend.states['fake-capture-0'][0] is False
+
+def test_external_volume_during_settle_window_is_not_lost(window, pump):
+    window.volume_slider.setValue(60)
+    window.commit_volume()
+    pump(0.1)
+    window.backend.simulate_external_change(level=0.3)
+    pump(2.0)
+    assert window.volume_slider.value() == 30
+
+def test_own_mute_is_not_reported_as_external(window, pump):
+    window.toggle_mute()
+    pump(1.0)
+    assert window.is_muted
+    assert window.backend.states['fake-capture-0'][0] is True
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from MicMaster import SILENCE_DBFS, MeteringEngine
+
+ENGINES = [True, False]
+
+@pytest.mark.parametrize('accelerated', ENGINES)
+def test_full_scale_negative_peak(accelerated):
+    samples = np.zeros(1024, dtype=np.int16)
+    samples[10] = -32768
+    reading = MeteringEngine(1024, accelerated=accelerated).process(samples.tobytes())
+    assert reading.peak == 1.0
+    assert reading.level == 100
+
+@pytest.mark.parametrize('accelerated', ENGINES)
+def test_silence(accelerated):
+    reading = MeteringEngine(1024, accelerated=accelerated).process(bytes(2048))
+    assert reading.peak == 0.0
+    assert reading.rms == 0.0
+    assert reading.dbfs == SILENCE_DBFS
+
+def test_implementations_agree():
+    rng = np.random.default_rng(0)
+    accelerated, fallback = MeteringEngine(1024), MeteringEngine(1024, accelerated=False)
+    for size in (256, 1024, 4096):
+        chunk = rng.normal(0, 3000, size).clip(-32768, 32767).astype(np.int16).tobytes()
+        first, second = accelerated.process(chunk), fallback.process(chunk)
+        assert first.peak == second.peak
+        assert first.level == second.level
+        assert first.rms == pytest.approx(second.rms, rel=1e-3)
+        assert first.dbfs == pytest.approx(second.dbfs, abs=0.01)
+
+@pytest.mark.parametrize('accelerated', ENGINES)
+def test_odd_trailing_byte_is_ignored(accelerated):
+    reading = MeteringEngine(1024, accelerated=accelerated).process(b'\x00\x10\x00')
+    assert reading.peak == 0.125
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from MicMaster import Profile
+
+@pytest.mark.parametrize('text', ['1e400', '-1e400', 'Infinity', 'NaN', '"50"', 'null', '[]'])
+def test_bad_number_only_resets_that_field(text):
+    data = json.loads(f'{{"volume": {text}, "mute_fade_ms": 250, "theme": "Light", "hotkey": "ctrl+m"}}')
+    profile = Profile.from_dict(data, 'Default')
+    assert profile.volume == Profile.DEFAULTS['volume']
+    assert profile.mute_fade_ms == 250
+    assert profile.theme == 'Light'
+    assert profile.hotkey == 'ctrl+m'
+
+@pytest.mark.parametrize('key', sorted(Profile.RANGES))
+def test_non_finite_ranged_value_is_rejected(key):
+    with pytest.raises(ValueError):
+        Profile.validate(key, float('inf'))
+    profile = Profile.from_dict({key: float('inf'), 'volume': 40})
+    assert getattr(profile, key) == Profile.DEFAULTS[key]
+    assert profile.volume == 40
+
+def test_numbers_are_clamped():
+    profile = Profile.from_dict({'volume': 1e300, 'capture_chunk': 1})
+    assert profile.volume == 100
+    assert profile.capture_chunk == Profile.RANGES['capture_chunk'][0]
+
+@pytest.mark.parametrize('action', [[], {}, None, 3, 'explode'])
+def test_bad_binding_only_drops_that_binding(action):
+    data = json.loads(json.dumps({'bindings': {'ctrl+m': action, 'f8': 'push_to_talk'}, 'volume': 40}))
+    profile = Profile.from_dict(data, 'Default')
+    assert profile.bindings == {'f8': 'push_to_talk'}
+    assert profile.volume == 40
+
+def test_unparseable_hotkey_only_drops_that_binding():
+    profile = Profile.from_dict({'bindings': {'ctrl+': 'toggle_mute', 'f9': 'push_to_mute'}})
+    assert profile.bindings == {'f9': 'push_to_mute'}
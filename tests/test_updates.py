@@ -0,0 +1,63 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from MicMaster import UpdateChecker
+
+pytest.importorskip('requests')
+
+class ReleaseHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({'tag_name': 'v99.0.0', 'assets': [{'browser_download_url': 'http://example.invalid/dl'}]}).encode()
+        self.send_response(200)
+        self.send_header('ETag', '"v99"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def release_url():
+    server = HTTPServer(('127.0.0.1', 0), ReleaseHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/latest'
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def dead_url():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f'http://127.0.0.1:{port}/latest'
+
+def check(url, cache_path, **kwargs):
+    return UpdateChecker(lambda result: None, url=url, cache_path=str(cache_path), timeout=2, **kwargs).check()
+
+def test_expired_cache_is_served_stale_when_offline(release_url, dead_url, tmp_path):
+    cache_path = tmp_path / 'update_cache.json'
+    fresh = check(release_url, cache_path)
+    assert fresh.status == 'update' and not fresh.from_cache
+    cache = json.loads(cache_path.read_text())
+    cache['url'] = dead_url
+    cache_path.write_text(json.dumps(cache))
+    result = check(dead_url, cache_path, ttl=0)
+    assert result.status == 'update'
+    assert result.latest_version == '99.0.0'
+    assert result.from_cache and result.stale
+    assert check(dead_url, cache_path, ttl=0).stale
+
+def test_error_without_cache_when_offline(dead_url, tmp_path):
+    with pytest.raises(Exception):
+        check(dead_url, tmp_path / 'update_cache.json')
+
+def test_fresh_cache_is_not_stale(release_url, tmp_path):
+    cache_path = tmp_path / 'update_cache.json'
+    check(release_url, cache_path)
+    result = check(release_url, cache_path)
+    assert result.from_cache and not result.stale
@@ -0,0 +1,59 @@
+from MicMaster import CaptureFormat, VoiceActivityDetector
+
+RATE = 16000
+FORMAT = CaptureFormat(RATE, 1, 1024)
+
+def silence(seconds: float) -> bytes:
+    return bytes(2 * int(RATE * seconds))
+
+def detector(on_change=None) -> VoiceActivityDetector:
+    return VoiceActivityDetector(on_change=on_change, hang_over=0.2)
+
+def test_silence_is_reported_once_until_reset():
+    changes = []
+    vad = detector(changes.append)
+    vad(silence(0.5), fmt=FORMAT)
+    vad(silence(0.5), fmt=FORMAT)
+    assert changes == [False]
+    vad.reset()
+    assert vad.speaking is None
+    vad(silence(0.5), fmt=FORMAT)
+    assert changes == [False, False]
+
+def test_manual_unmute_rearms_auto_mute(window, pump):
+    window.vad = detector(window.voice_activity_signal.emit)
+    window.vad(silence(0.5), fmt=FORMAT)
+    pump(0.1)
+    assert window.is_muted and window.vad_muted
+    window.toggle_mute()
+    assert not window.is_muted
+    window.vad(silence(0.5), fmt=FORMAT)
+    pump(0.1)
+    assert window.is_muted and window.vad_muted
+
+def test_enabling_while_muted_auto_mutes_after_unmute(window, pump):
+    window.toggle_mute()
+    window.vad = detector(window.voice_activity_signal.emit)
+    window.vad(silence(0.5), fmt=FORMAT)
+    pump(0.1)
+    assert window.is_muted and not window.vad_muted
+    window.toggle_mute()
+    window.vad(silence(0.5), fmt=FORMAT)
+    pump(0.1)
+    assert window.is_muted and window.vad_muted
+
+def test_external_unmute_rearms_auto_mute(window, pump):
+    window.vad = detector(window.voice_activity_signal.emit)
+    window.vad(silence(0.5), fmt=FORMAT)
+    pump(0.1)
+    assert window.is_muted
+    pump(1.0)
+    window.backend.simulate_external_change(muted=False)
+    deadline = 50
+    while window.is_muted and deadline:
+        pump(0.1)
+        deadline -= 1
+    assert not window.is_muted
+    window.vad(silence(0.5), fmt=FORMAT)
+    pump(0.1)
+    assert window.is_muted and window.vad_muted